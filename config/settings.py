@@ -12,6 +12,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",  # Allow extra env vars without error
+        frozen=True,  # Read-only once loaded; get_settings() shares one instance
     )
 
     # API
@@ -44,6 +45,13 @@ class Settings(BaseSettings):
     api_timeout_seconds: int = 12  # Per-model timeout; reduced from 20s with thinking disabled
     gemini_max_retries: int = 0  # No retry per model – fall to next model immediately
     gemini_retry_delay_seconds: float = 0.5  # Kept for compatibility (unused when retries=0)
+    # Hedged requests: start the fallback model this many seconds after the
+    # primary and take whichever answers first (0 = sequential fallback)
+    gemini_hedge_delay_seconds: float = 0.0
+    # Classifier micro-batching: concurrent classify() calls arriving within
+    # this window share one Gemini call returning a JSON array (0 = off)
+    classifier_batch_window_ms: float = 0.0
+    classifier_batch_max: int = 16
 
     # Engagement Policy
     max_engagement_turns_cautious: int = 10
@@ -55,6 +63,13 @@ class Settings(BaseSettings):
     # Context Windowing (to reduce latency on deep conversations)
     context_window_turns: int = 8  # Limit conversation history to last N turns
 
+    # Agent response cache (skips the LLM for repeated identical turns; opt-in)
+    response_cache_enabled: bool = False
+    response_cache_max_entries: int = 1024
+
+    # Per-conversation fake data kept in memory (LRU-evicted beyond this)
+    fake_data_cache_max_entries: int = 10_000
+
     # Environment
     environment: str = "development"  # development, staging, production
 
@@ -5,7 +5,9 @@ from src.agents.persona import Persona, PersonaManager, PersonaTrait, EmotionalS
 from src.agents.policy import EngagementPolicy, EngagementMode, EngagementState
 from src.agents.prompts import (
     HONEYPOT_SYSTEM_PROMPT,
+    bind_fake_data_section,
     get_response_strategy,
+    render_system_prompt,
 )
 
 __all__ = [
@@ -20,5 +22,7 @@ __all__ = [
     "EngagementMode",
     "EngagementState",
     "HONEYPOT_SYSTEM_PROMPT",
+    "bind_fake_data_section",
     "get_response_strategy",
+    "render_system_prompt",
 ]
@@ -1,18 +1,22 @@
 """Main honeypot agent implementation using Gemini 3 Pro."""
 
 import asyncio
-import hashlib
-import json
 import os
 import random
+import re
 import time
 import uuid
+import zlib
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 
+import httpx
+import orjson
 import structlog
 from google import genai
 from google.genai import types
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from config.settings import get_settings
 from src.api.schemas import (
@@ -24,10 +28,16 @@ from src.api.schemas import (
     SenderType,
 )
 from src.detection.detector import DetectionResult
-from src.agents.prompts import HONEYPOT_SYSTEM_PROMPT
+from src.agents.prompts import (
+    PromptSegments,
+    bind_fake_data_section,
+    render_system_prompt,
+)
 from src.agents.persona import PersonaManager, Persona
 from src.agents.policy import EngagementPolicy, EngagementMode, EngagementState
+from src.agents.response_cache import ResponseCache
 from src.agents.fake_data import FakeDataGenerator, FakeCreditCard, FakeBankAccount, FakePersona
+from src.hedging import hedged_call
 
 # Safety settings for Gemini to allow scam roleplay (for honeypot context)
 # Using BLOCK_NONE for Gemini 3 Preview models which have stricter default filters
@@ -50,8 +60,45 @@ HONEYPOT_SAFETY_SETTINGS = [
     ),
 ]
 
+# thinking_budget=0 = disable thinking to minimize latency.
+# The prompt + missing_intel injection provides clear targeting
+# without model needing to reason. Keeps responses under 20s.
+HONEYPOT_THINKING_CONFIG = types.ThinkingConfig(thinking_budget=0)
+AGENT_MAX_OUTPUT_TOKENS = 2048
+
 logger = structlog.get_logger()
 
+# Connection pool bounds for the shared async Gemini client
+LLM_MAX_CONNECTIONS = 100
+LLM_MAX_KEEPALIVE_CONNECTIONS = 50
+
+# In-character replies used when every model attempt fails
+_FALLBACK_RESPONSES: tuple[str, ...] = (
+    "I'm sorry, I'm a bit confused. Can you explain that again?",
+    "My phone is acting up. What do I need to do exactly?",
+    "I didn't understand. Can you tell me step by step?",
+    "Okay, but what should I do first? I'm worried.",
+)
+
+# Dedicated generator so fallback picks don't share the module-level random state
+_RNG = random.Random()
+
+# Built once: validate_json parses and validates in a single pydantic-core pass
+_AGENT_RESPONSE_ADAPTER = TypeAdapter(AgentJsonResponse)
+
+# Intel patterns for summarizing truncated history, compiled once rather than
+# going through re's compile cache on every summary
+_SUMMARY_PHONE_PATTERN = re.compile(r'\+?91[-\s]?\d{10}|\b\d{10}\b')
+_SUMMARY_UPI_PATTERN = re.compile(r'[\w.-]+@[a-zA-Z]{2,}')
+_SUMMARY_URL_PATTERN = re.compile(r'https?://[^\s]+', re.IGNORECASE)
+_SUMMARY_EMAIL_PATTERN = re.compile(r'[\w.-]+@[\w.-]+\.\w{2,}')
+
+# URLs in a scammer message, for spotting links not yet extracted
+_MESSAGE_URL_PATTERN = re.compile(
+    r"https?://[\w.-]+(?:\.[a-z]{2,10})+(?:/[^\s<>\"'{}|\\^`\[\]]*)?",
+    re.IGNORECASE,
+)
+
 
 def _extract_text_from_response(response) -> str:
     """Extract text from Gemini response without triggering thought_signature warning.
@@ -65,21 +112,77 @@ def _extract_text_from_response(response) -> str:
     Returns:
         Concatenated text from all text parts
     """
-    if not response.candidates:
-        return ""
-    
-    text_parts = []
-    for candidate in response.candidates:
-        if candidate.content and candidate.content.parts:
-            for part in candidate.content.parts:
-                # Only extract text parts, skip thought_signature and other non-text parts
-                if hasattr(part, 'text') and part.text:
-                    text_parts.append(part.text)
-    
-    return "".join(text_parts)
+    # Only extract text parts, skip thought_signature and other non-text parts
+    return "".join(
+        part.text
+        for candidate in (response.candidates or ())
+        if candidate.content and candidate.content.parts
+        for part in candidate.content.parts
+        if getattr(part, "text", None)
+    )
+
+
+class _JsonObjectTracker:
+    """Incrementally detect when the first top-level JSON object is closed.
+
+    Braces inside JSON strings (including escaped quotes) are ignored, so a
+    reply like ``"wait {what}"`` does not end the object early.
+    """
+
+    __slots__ = ("_depth", "_escaped", "_in_string")
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> bool:
+        """Consume the next chunk of text; return True once the object has closed."""
+        for char in text:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = self._depth > 0
+            elif char == "{":
+                self._depth += 1
+            elif char == "}" and self._depth:
+                self._depth -= 1
+                if not self._depth:
+                    return True
+        return False
+
 
+@lru_cache(maxsize=4)
+def _get_client(vertexai: bool, project: str, location: str) -> genai.Client:
+    """Return a shared Gemini client for the given Vertex AI target.
 
-@dataclass
+    Every agent instance reuses the same client, and with it one async
+    connection pool, so concurrent engagements share warm TLS connections
+    instead of each paying the handshake. The pool is passed in as an httpx
+    client: that also pins the SDK to httpx, which would otherwise switch to
+    aiohttp when installed and drop the ``limits``.
+    """
+    return genai.Client(
+        vertexai=vertexai,
+        project=project,
+        location=location,
+        http_options=types.HttpOptions(
+            httpx_async_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            ),
+        ),
+    )
+
+
+@dataclass(slots=True)
 class EngagementResult:
     """Result of agent engagement."""
 
@@ -113,20 +216,39 @@ class HoneypotAgent:
         if self.settings.google_application_credentials:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = self.settings.google_application_credentials
         
-        # Initialize Gemini client with Vertex AI credentials from settings
-        self.client = genai.Client(
-            vertexai=self.settings.google_genai_use_vertexai,
-            project=self.settings.google_cloud_project,
-            location=self.settings.google_cloud_location,
+        # Shared Gemini client with Vertex AI credentials from settings
+        self.client = _get_client(
+            self.settings.google_genai_use_vertexai,
+            self.settings.google_cloud_project,
+            self.settings.google_cloud_location,
         )
         
         # Primary model (Gemini 3 Pro) and fallback (Gemini 2.5 Pro)
         self.model = self.settings.pro_model  # gemini-3-pro-preview
         self.fallback_model = self.settings.fallback_pro_model  # gemini-2.5-pro
         self._last_model_used: str | None = None  # Track which model was used
+        self._hedge_delay = self.settings.gemini_hedge_delay_seconds
+
+        # Static generation settings, validated once; only the system
+        # instruction changes per turn
+        self._base_config = types.GenerateContentConfig(
+            temperature=self.settings.llm_temperature,
+            max_output_tokens=AGENT_MAX_OUTPUT_TOKENS,
+            safety_settings=HONEYPOT_SAFETY_SETTINGS,
+            thinking_config=HONEYPOT_THINKING_CONFIG,
+        )
         
-        # Fake data generators per conversation (seeded by conversation_id)
-        self._fake_data_cache: dict[str, dict] = {}
+        # Fake data generators per conversation (seeded by conversation_id).
+        # LRU-bounded: conversations that time out never call end_conversation.
+        self._fake_data_cache: OrderedDict[str, dict] = OrderedDict()
+        self._fake_data_cache_max = self.settings.fake_data_cache_max_entries
+
+        # Cache of parsed replies for repeated conversation states
+        self._response_cache: ResponseCache | None = (
+            ResponseCache(max_entries=self.settings.response_cache_max_entries)
+            if self.settings.response_cache_enabled
+            else None
+        )
 
     async def engage(
         self,
@@ -138,6 +260,7 @@ class HoneypotAgent:
         turn_number: int | None = None,
         missing_intel: list[str] | None = None,
         extracted_intel: dict | None = None,
+        defer_notes: bool = False,
     ) -> EngagementResult:
         """
         Engage with the scammer and generate a response.
@@ -149,11 +272,13 @@ class HoneypotAgent:
             detection: Scam detection result
             conversation_id: Optional existing conversation ID
             turn_number: Optional turn number override (calculated from history length)
+            defer_notes: Leave notes empty for callers that render them once
+                after merging their own intelligence
 
         Returns:
             EngagementResult with the agent's response
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         # Generate or use existing conversation ID
         conv_id = conversation_id or str(uuid.uuid4())
@@ -197,13 +322,14 @@ class HoneypotAgent:
         )
 
         # Generate response using Gemini 3 Pro
-        fake_data_section = self._format_fake_data_section(fake_data)
+        fake_data_section = fake_data["formatted_section"]
         llm_extracted_intel: ExtractedIntelligence | None = None
         try:
             response, llm_extracted_intel = await self._generate_response(
                 prompt,
                 persona,
                 fake_data_section,
+                system_prompt_segments=fake_data["system_prompt_segments"],
                 extracted_intel=extracted_intel,
                 missing_intel=missing_intel,
             )
@@ -212,7 +338,7 @@ class HoneypotAgent:
             response = self._get_fallback_response(detection)
 
         # Calculate duration
-        duration = int(time.time() - start_time)
+        duration = (time.monotonic_ns() - start_ns) // 1_000_000_000
 
         # Check if scammer's message contains URLs that weren't extracted yet
         has_unextracted_urls = self._has_unextracted_urls(
@@ -234,7 +360,9 @@ class HoneypotAgent:
         exit_reason = self.policy.get_exit_reason(state) if not should_continue else None
 
         # Generate notes with actual turn number (intelligence will be added in routes.py after merging)
-        notes = self._generate_notes(detection, persona, engagement_mode, actual_turn, extracted_intel=None)
+        notes = "" if defer_notes else self._generate_notes(
+            detection, persona, engagement_mode, actual_turn, extracted_intel=None
+        )
 
         return EngagementResult(
             response=response,
@@ -261,11 +389,14 @@ class HoneypotAgent:
         Returns:
             Dictionary with all fake data for this conversation
         """
-        if conversation_id in self._fake_data_cache:
-            return self._fake_data_cache[conversation_id]
+        cached = self._fake_data_cache.get(conversation_id)
+        if cached is not None:
+            self._fake_data_cache.move_to_end(conversation_id)
+            return cached
         
-        # Create deterministic seed from conversation_id
-        seed = int(hashlib.md5(conversation_id.encode()).hexdigest()[:8], 16)
+        # Deterministic 32-bit seed from conversation_id (stable across processes,
+        # unlike hash(); no cryptographic strength needed for a seed)
+        seed = zlib.crc32(conversation_id.encode("utf-8"))
         generator = FakeDataGenerator(seed=seed)
         
         # Generate all fake data upfront for consistency
@@ -293,8 +424,14 @@ class HoneypotAgent:
             "persona_address": persona_details.address,
             "customer_id": persona_details.customer_id,
         }
+        # Prompt section is identical every turn; format it once per conversation
+        formatted_section = self._format_fake_data_section(fake_data)
+        fake_data["formatted_section"] = formatted_section
+        fake_data["system_prompt_segments"] = bind_fake_data_section(formatted_section)
         
         self._fake_data_cache[conversation_id] = fake_data
+        if len(self._fake_data_cache) > self._fake_data_cache_max:
+            self._fake_data_cache.popitem(last=False)
         self.logger.debug(
             "Generated fake data for conversation",
             conversation_id=conversation_id,
@@ -315,18 +452,20 @@ class HoneypotAgent:
         Returns:
             Formatted string for inclusion in system prompt
         """
-        return f"""- Credit Card: {fake_data['card_number_formatted']} (type: {fake_data['credit_card'].card_type})
-- Card Expiry: {fake_data['card_expiry']}
-- Card CVV: {fake_data['card_cvv']}
-- Bank Account: {fake_data['account_number']}
-- IFSC Code: {fake_data['ifsc_code']} ({fake_data['bank_name']})
-- OTP/Verification Code: {fake_data['otp']}
-- Aadhaar Number: {fake_data['aadhaar']}
-- PAN Card: {fake_data['pan']}
-- Your Name: {fake_data['persona_name']}
-- Your Age: {fake_data['persona_age']}
-- Your Address: {fake_data['persona_address']}
-- Customer ID: {fake_data['customer_id']}"""
+        return "\n".join((
+            f"- Credit Card: {fake_data['card_number_formatted']} (type: {fake_data['credit_card'].card_type})",
+            f"- Card Expiry: {fake_data['card_expiry']}",
+            f"- Card CVV: {fake_data['card_cvv']}",
+            f"- Bank Account: {fake_data['account_number']}",
+            f"- IFSC Code: {fake_data['ifsc_code']} ({fake_data['bank_name']})",
+            f"- OTP/Verification Code: {fake_data['otp']}",
+            f"- Aadhaar Number: {fake_data['aadhaar']}",
+            f"- PAN Card: {fake_data['pan']}",
+            f"- Your Name: {fake_data['persona_name']}",
+            f"- Your Age: {fake_data['persona_age']}",
+            f"- Your Address: {fake_data['persona_address']}",
+            f"- Customer ID: {fake_data['customer_id']}",
+        ))
 
     def _generate_conversation_summary(self, truncated_turns: list[ConversationMessage]) -> str:
         """Generate a concise summary of earlier conversation turns that were
@@ -345,14 +484,6 @@ class HoneypotAgent:
         if not truncated_turns:
             return ""
 
-        import re as _re
-
-        # Patterns to detect key intel in older messages
-        PHONE_RE = _re.compile(r'\+?91[-\s]?\d{10}|\b\d{10}\b')
-        UPI_RE = _re.compile(r'[\w.-]+@[a-zA-Z]{2,}')
-        URL_RE = _re.compile(r'https?://[^\s]+', _re.IGNORECASE)
-        EMAIL_RE = _re.compile(r'[\w.-]+@[\w.-]+\.\w{2,}')
-
         scammer_claims: list[str] = []
         agent_actions: list[str] = []
         intel_found: list[str] = []
@@ -368,10 +499,10 @@ class HoneypotAgent:
             )
 
             if is_scammer:
-                phones = PHONE_RE.findall(text)
-                upis = UPI_RE.findall(text)
-                urls = URL_RE.findall(text)
-                emails = EMAIL_RE.findall(text)
+                phones = _SUMMARY_PHONE_PATTERN.findall(text)
+                upis = _SUMMARY_UPI_PATTERN.findall(text)
+                urls = _SUMMARY_URL_PATTERN.findall(text)
+                emails = _SUMMARY_EMAIL_PATTERN.findall(text)
 
                 if phones:
                     intel_found.append(f"phone: {', '.join(phones)}")
@@ -432,15 +563,9 @@ class HoneypotAgent:
         if len(history) > max_turns:
             older_turns = history[:-max_turns]
             summary_text = self._generate_conversation_summary(older_turns)
-            truncated_history = history[-max_turns:]
-        else:
-            truncated_history = history
 
         # Format conversation history
-        history_text = ""
-        for msg in truncated_history:
-            sender = "SCAMMER" if msg.sender == SenderType.SCAMMER else "YOU"
-            history_text += f"[{sender}]: {msg.text}\n"
+        history_text = "".join(self._recent_history_lines(persona, history, max_turns))
 
         # Build prompt with optional summary
         if summary_text:
@@ -464,17 +589,44 @@ Generate your response as Pushpa Verma:"""
 
         return prompt
 
+    @staticmethod
+    def _format_history_line(msg: ConversationMessage) -> str:
+        """Format one history message as a prompt line."""
+        sender = "SCAMMER" if msg.sender == SenderType.SCAMMER else "YOU"
+        return f"[{sender}]: {msg.text}\n"
+
+    def _recent_history_lines(
+        self,
+        persona: Persona,
+        history: list[ConversationMessage],
+        max_turns: int,
+    ) -> deque[str]:
+        """Return formatted lines for the last ``max_turns`` history messages.
+
+        The persona keeps a rolling deque across turns, so only messages added
+        since the previous turn are formatted. The window is rebuilt if the
+        history no longer extends what was seen before.
+        """
+        lines = persona.history_lines
+        seen = persona.history_seen
+        diverged = (
+            lines.maxlen != max_turns
+            or seen > len(history)
+            or (seen and lines and lines[-1] != self._format_history_line(history[seen - 1]))
+        )
+        if diverged:
+            lines = persona.history_lines = deque(maxlen=max_turns)
+            seen = max(0, len(history) - max_turns)
+
+        lines.extend(self._format_history_line(msg) for msg in history[seen:])
+        persona.history_seen = len(history)
+        return lines
+
     @staticmethod
     def _extract_json_text(raw: str) -> str:
         """Strip markdown code fences and return inner text."""
-        text = raw.strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        elif text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        return text.strip()
+        text = raw.strip().removeprefix("```json").removeprefix("```")
+        return text.removesuffix("```").strip()
 
     def _parse_agent_json_response(self, response_text: str) -> AgentJsonResponse | None:
         """Parse the JSON response from the agent. Returns None if parsing fails.
@@ -484,13 +636,50 @@ Generate your response as Pushpa Verma:"""
         """
         try:
             text = self._extract_json_text(response_text)
-            data = json.loads(text)
-
-            return AgentJsonResponse(**data)
-        except (json.JSONDecodeError, ValidationError, KeyError, TypeError) as e:
-            self.logger.warning(f"Failed to parse agent JSON response: {e}")
+            return _AGENT_RESPONSE_ADAPTER.validate_json(text)
+        except ValidationError as e:
+            self.logger.warning("Failed to parse agent JSON response", error=str(e))
             return None
 
+    async def _call_model(
+        self,
+        model_name: str,
+        prompt: str,
+        config: types.GenerateContentConfig,
+        timeout_seconds: float,
+    ) -> str:
+        """Stream one generation and return its text parts.
+
+        Streaming stops as soon as the top-level JSON reply object closes, so
+        trailing tokens after the reply are never waited for.
+        """
+
+        async def _consume() -> str:
+            # Native async client: no executor thread per call, so the
+            # event loop can overlap many in-flight LLM requests
+            stream = await self.client.aio.models.generate_content_stream(
+                model=model_name,
+                contents=prompt,
+                config=config,
+            )
+            tracker = _JsonObjectTracker()
+            chunks: list[str] = []
+            try:
+                async for chunk in stream:
+                    # Use helper to avoid thought_signature warning in Gemini 3
+                    text = _extract_text_from_response(chunk)
+                    chunks.append(text)
+                    if tracker.feed(text):
+                        break
+            finally:
+                # Release the HTTP stream now rather than when it is GC'd
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            return "".join(chunks)
+
+        return await asyncio.wait_for(_consume(), timeout=timeout_seconds)
+
     async def _generate_response(
         self,
         prompt: str,
@@ -498,6 +687,7 @@ Generate your response as Pushpa Verma:"""
         fake_data_section: str = "",
         extracted_intel: dict | None = None,
         missing_intel: list[str] | None = None,
+        system_prompt_segments: PromptSegments | None = None,
     ) -> tuple[str, ExtractedIntelligence | None]:
         """Generate response using Gemini Pro with fallback to Gemini 2.5.
         
@@ -505,72 +695,95 @@ Generate your response as Pushpa Verma:"""
             Tuple of (response_text, extracted_intelligence)
         """
         
-        # Format extracted intelligence as JSON for the prompt
-        extracted_intel = extracted_intel or {}
-        extracted_intel_json = json.dumps(extracted_intel, indent=2) if extracted_intel else "None yet"
+        # Format extracted intelligence as compact JSON for the prompt, leaving
+        # out empty categories so they don't cost prompt tokens
+        found_intel = {k: v for k, v in (extracted_intel or {}).items() if v}
+        extracted_intel_json = (
+            orjson.dumps(found_intel).decode()
+            if found_intel
+            else "None yet"
+        )
         
         # Format missing intelligence as a readable list
         missing_intel = missing_intel or []
         missing_intel_text = ", ".join(missing_intel) if missing_intel else "All intelligence collected!"
         
-        # Format system instruction with state injection
-        system_instruction = HONEYPOT_SYSTEM_PROMPT.format(
+        # Format system instruction with state injection (fake data is bound
+        # once per conversation; only per-turn state is rendered here)
+        if system_prompt_segments is None:
+            system_prompt_segments = bind_fake_data_section(
+                fake_data_section or "(No fake data available)"
+            )
+        system_instruction = render_system_prompt(
+            system_prompt_segments,
             turn_number=persona.engagement_turn,
             extracted_intelligence=extracted_intel_json,
             missing_intelligence=missing_intel_text,
-            fake_data_section=fake_data_section or "(No fake data available)",
         )
+
+        # Repeated scam templates hit the same state: skip the LLM round trip
+        response_cache = self._response_cache
+        cache_key: str | None = None
+        if response_cache is not None:
+            cache_key = ResponseCache.make_key(
+                prompt,
+                system_instruction,
+                persona.emotional_state.value,
+            )
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                self._last_model_used = "cache"
+                self.logger.info("Response cache hit", cache_size=len(response_cache))
+                return cached
         
+        # Same config for every model attempt this turn; model_copy reuses the
+        # validated base config instead of re-validating every field
+        config = self._base_config.model_copy(
+            update={"system_instruction": system_instruction}
+        )
+
         # Try primary model (Gemini 3 Pro) first, then fallback (Gemini 2.5 Pro)
         models_to_try = [self.model, self.fallback_model]
         response_text = None
         timeout_seconds = self.settings.api_timeout_seconds
         max_retries = self.settings.gemini_max_retries
         retry_delay = self.settings.gemini_retry_delay_seconds
-        
+
+        if self._hedge_delay > 0:
+            # Hedged mode replaces the sequential loop below
+            hedged = await hedged_call(
+                lambda model_name: self._call_model(model_name, prompt, config, timeout_seconds),
+                self.model,
+                self.fallback_model,
+                self._hedge_delay,
+                self.logger,
+            )
+            if hedged is not None:
+                self._last_model_used, response_text = hedged
+                self.logger.info(
+                    "Response generated successfully",
+                    model=self._last_model_used,
+                    response_length=len(response_text),
+                    hedged=True,
+                )
+            models_to_try = []
+
         for model_name in models_to_try:
             # Retry loop for timeout handling
             for attempt in range(max_retries + 1):
                 try:
                     self.logger.debug(
-                        f"Trying model: {model_name}",
+                        "Trying model",
+                        model=model_name,
                         attempt=attempt + 1,
                         max_retries=max_retries,
                         timeout=timeout_seconds,
                     )
-                    
-                    # thinking_budget=0 = disable thinking to minimize latency.
-                    # The prompt + missing_intel injection provides clear targeting
-                    # without model needing to reason. Keeps responses under 20s.
-                    max_tokens = 2048
-                    
-                    # Build config with model-specific settings
-                    config = types.GenerateContentConfig(
-                        system_instruction=system_instruction,
-                        temperature=self.settings.llm_temperature,
-                        max_output_tokens=max_tokens,
-                        safety_settings=HONEYPOT_SAFETY_SETTINGS,
-                        thinking_config=types.ThinkingConfig(
-                            thinking_budget=0,
-                        ),
-                    )
-                    
-                    # Wrap API call with timeout
-                    response = await asyncio.wait_for(
-                        asyncio.get_event_loop().run_in_executor(
-                            None,
-                            lambda: self.client.models.generate_content(
-                                model=model_name,
-                                contents=prompt,
-                                config=config,
-                            )
-                        ),
-                        timeout=timeout_seconds,
+
+                    response_text = await self._call_model(
+                        model_name, prompt, config, timeout_seconds
                     )
                     
-                    # Use helper to avoid thought_signature warning in Gemini 3
-                    response_text = _extract_text_from_response(response)
-                    
                     # Check if we got a valid response
                     if response_text and len(response_text.strip()) > 0:
                         self._last_model_used = model_name
@@ -597,7 +810,8 @@ Generate your response as Pushpa Verma:"""
                     )
                     if attempt < max_retries:
                         self.logger.info(
-                            f"Retrying after {retry_delay}s delay",
+                            "Retrying after delay",
+                            delay_seconds=retry_delay,
                             remaining_retries=max_retries - attempt,
                         )
                         await asyncio.sleep(retry_delay)
@@ -639,12 +853,14 @@ Generate your response as Pushpa Verma:"""
                     parsed.extracted_intelligence.phishingLinks
                 )
             )
+            if response_cache is not None and cache_key is not None:
+                response_cache.put(cache_key, parsed.reply_text, parsed.extracted_intelligence)
             return parsed.reply_text, parsed.extracted_intelligence
         
         # Safety net: full Pydantic parse failed, but if the text looks like JSON
         # try to at least extract reply_text so we never return raw JSON as the reply.
         try:
-            raw_json = json.loads(self._extract_json_text(response_text))
+            raw_json = orjson.loads(self._extract_json_text(response_text))
             if isinstance(raw_json, dict) and "reply_text" in raw_json:
                 reply = raw_json["reply_text"]
                 self.logger.info("Extracted reply_text from partially-valid JSON")
@@ -657,7 +873,7 @@ Generate your response as Pushpa Verma:"""
                     except Exception:
                         pass  # skip intel if it can't be parsed
                 return reply, salvaged_intel
-        except (json.JSONDecodeError, KeyError, TypeError):
+        except (orjson.JSONDecodeError, KeyError, TypeError):
             pass
 
         # Fallback: return raw response if JSON parsing fails
@@ -666,13 +882,7 @@ Generate your response as Pushpa Verma:"""
 
     def _get_fallback_response(self, detection: DetectionResult) -> str:
         """Get a fallback response if LLM fails."""
-        fallback_responses = [
-            "I'm sorry, I'm a bit confused. Can you explain that again?",
-            "My phone is acting up. What do I need to do exactly?",
-            "I didn't understand. Can you tell me step by step?",
-            "Okay, but what should I do first? I'm worried.",
-        ]
-        return random.choice(fallback_responses)
+        return _RNG.choice(_FALLBACK_RESPONSES)
 
     def _generate_notes(
         self, 
@@ -743,16 +953,8 @@ Generate your response as Pushpa Verma:"""
         Returns:
             True if message contains unextracted URLs
         """
-        import re
-        
-        # Same pattern as extractor uses
-        URL_PATTERN = re.compile(
-            r"https?://[\w.-]+(?:\.[a-z]{2,10})+(?:/[^\s<>\"'{}|\\^`\[\]]*)?",
-            re.IGNORECASE,
-        )
-        
         # Find all URLs in the message
-        urls_in_message = URL_PATTERN.findall(message_text)
+        urls_in_message = _MESSAGE_URL_PATTERN.findall(message_text)
         
         if not urls_in_message:
             return False
@@ -775,8 +977,7 @@ Generate your response as Pushpa Verma:"""
         """Clean up persona and fake data when conversation ends."""
         self.persona_manager.clear_persona(conversation_id)
         # Clear fake data cache for this conversation
-        if conversation_id in self._fake_data_cache:
-            del self._fake_data_cache[conversation_id]
+        self._fake_data_cache.pop(conversation_id, None)
 
 
 # Singleton instance for reuse
@@ -1,5 +1,6 @@
 """Human persona management for the honeypot agent."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -30,7 +31,7 @@ class EmotionalState(str, Enum):
     NEUTRAL = "neutral"  # For unknown scam types - no strong emotion
 
 
-@dataclass
+@dataclass(slots=True)
 class Persona:
     """Represents the honeypot's human persona."""
 
@@ -46,6 +47,11 @@ class Persona:
     claimed_issues: list[str] = field(default_factory=list)
     mentioned_details: dict[str, Any] = field(default_factory=dict)
 
+    # Rolling window of formatted history lines for the prompt, and how many
+    # history messages have been folded into it so far
+    history_lines: deque[str] = field(default_factory=deque)
+    history_seen: int = 0
+
     def update_emotional_state(self, scam_intensity: float, scam_type: str | None = None) -> None:
         """
         Update emotional state based on scam type and intensity.
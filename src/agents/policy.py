@@ -14,7 +14,7 @@ class EngagementMode(str, Enum):
     AGGRESSIVE = "aggressive"  # High confidence scam, full engagement
 
 
-@dataclass
+@dataclass(slots=True)
 class EngagementState:
     """Current state of an engagement."""
     
@@ -7,6 +7,11 @@ Uses One-Pass JSON architecture: the agent returns both reply and extracted inte
 in a single response.
 """
 
+from collections.abc import Mapping
+from string import Formatter
+from types import MappingProxyType
+from typing import Final, TypedDict, Unpack
+
 # Agentic honeypot system prompt - the LLM decides strategy based on context
 HONEYPOT_SYSTEM_PROMPT = """You are a honeypot agent playing "Pushpa Verma", a naive elderly victim. Extract intelligence from scammers while staying in character.
 
@@ -115,47 +120,108 @@ DO NOT EXTRACT (victim's details): "your account [number]", "your registered mob
 Only populate arrays with SCAMMER's details found in their message. Empty arrays if nothing found.
 """
 
+# HONEYPOT_SYSTEM_PROMPT pre-parsed into (literal, field_name) segments so the
+# ~2 KB template is scanned for braces once at import, not on every turn.
+PromptSegments = tuple[tuple[str, str | None], ...]
+
+_SYSTEM_PROMPT_SEGMENTS: PromptSegments = tuple(
+    (literal, field_name)
+    for literal, field_name, _spec, _conversion in Formatter().parse(HONEYPOT_SYSTEM_PROMPT)
+)
+
+
+def bind_fake_data_section(fake_data_section: str) -> PromptSegments:
+    """Inline a conversation's fake data into the system prompt segments.
+
+    The fake data section is constant for a conversation, so this runs once
+    per conversation; only the per-turn state fields are left unbound.
+
+    Args:
+        fake_data_section: Formatted fake data block for this conversation
+
+    Returns:
+        Segments to pass to render_system_prompt each turn
+    """
+    bound: list[tuple[str, str | None]] = []
+    pending = ""
+    for literal, field_name in _SYSTEM_PROMPT_SEGMENTS:
+        pending += literal
+        if field_name == "fake_data_section":
+            pending += fake_data_section
+        elif field_name is not None:
+            bound.append((pending, field_name))
+            pending = ""
+    bound.append((pending, None))
+    return tuple(bound)
+
+
+class SystemPromptState(TypedDict):
+    """Per-turn fields left unbound by bind_fake_data_section."""
+
+    turn_number: int
+    extracted_intelligence: str
+    missing_intelligence: str
+
+
+def render_system_prompt(segments: PromptSegments, **state: Unpack[SystemPromptState]) -> str:
+    """Render bound prompt segments with per-turn state.
+
+    Args:
+        segments: Output of bind_fake_data_section
+        **state: turn_number, extracted_intelligence, missing_intelligence
+
+    Returns:
+        The full system instruction for this turn
+    """
+    # Field names come from the template, so look them up untyped
+    values: Mapping[str, object] = state
+    return "".join([
+        piece
+        for literal, field_name in segments
+        for piece in (literal, str(values[field_name]) if field_name else "")
+    ])
+
 # Response variation examples by scam type (guidance for tone, not templates to copy)
-RESPONSE_STRATEGIES = {
-    "urgency": [
+RESPONSE_STRATEGIES: Final[Mapping[str, tuple[str, ...]]] = MappingProxyType({
+    "urgency": (
         "wait what is happening. i am at work can this wait",
         "ok ok let me understand. what exactly do i need to do here",
         "i will try to do it. please explain slowly i am not good with phones",
         "one minute let me sit down. this is confusing me",
         "alright tell me what to do. i dont want problems",
-    ],
-    "authority": [
+    ),
+    "authority": (
         "you are from {authority}. how do i know this is real",
         "yes i want to help. what papers do you need from me",
         "ok if its from {authority} then i will do it. what is the process",
         "i always pay my taxes on time. what is the issue exactly",
         "let me get my glasses. what did you say your name was",
-    ],
-    "financial": [
+    ),
+    "financial": (
         "i dont have much money right now. how much is it exactly",
         "which account do i send to. i want to make sure its correct",
         "i have paytm. what is your upi id i can try to send",
         "my son usually helps me with this. can you explain it simply",
         "ok but i only have limited balance. is that ok",
-    ],
-    "threat": [
+    ),
+    "threat": (
         "please dont do that. i will cooperate just tell me what to do",
         "i dont want legal problem. how do i fix this",
         "ok ok i am scared now. what is the next step",
         "my heart is beating fast. give me one minute",
         "i will do whatever you say. just dont block anything",
-    ],
-}
+    ),
+})
 
 
-def get_response_strategy(scam_category: str) -> list[str]:
+def get_response_strategy(scam_category: str) -> tuple[str, ...]:
     """Get response strategies for a scam category.
     
     Args:
         scam_category: The category of scam (urgency, authority, financial, threat)
         
     Returns:
-        List of example response strategies for that category
+        Tuple of example response strategies for that category
     """
     return RESPONSE_STRATEGIES.get(scam_category, RESPONSE_STRATEGIES["urgency"])
 
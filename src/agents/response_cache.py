@@ -0,0 +1,66 @@
+"""In-process response cache for the honeypot agent.
+
+Scam platforms retry deliveries, so the same turn of the same conversation
+can reach the LLM more than once. Caching the parsed agent reply lets a
+repeated turn skip the multi-second Gemini round trip.
+
+The key covers the full prompt and the full rendered system instruction,
+which carries the conversation's fake data, the extracted intelligence and
+the turn number. A hit therefore only ever replays a reply (and its
+extracted intelligence) generated for the exact same message and state;
+different conversations never share an entry. Disabled by default
+(``RESPONSE_CACHE_ENABLED``).
+"""
+
+import hashlib
+from collections import OrderedDict
+
+from src.api.schemas import ExtractedIntelligence
+
+
+class ResponseCache:
+    """Bounded LRU cache of agent replies keyed by the exact model input."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize an empty cache holding at most ``max_entries`` replies."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, ExtractedIntelligence | None]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(prompt: str, system_instruction: str, emotional_state: str) -> str:
+        """Build a cache key from everything the model sees for this turn.
+
+        Nothing is truncated or normalized: two inputs only share an entry
+        when the prompt and the system instruction are identical.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (emotional_state, system_instruction, prompt):
+            # Length-prefix each part so boundaries can't shift between fields
+            encoded = part.encode("utf-8")
+            digest.update(len(encoded).to_bytes(8, "big"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> tuple[str, ExtractedIntelligence | None] | None:
+        """Return the cached (reply_text, intelligence) for ``key``, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, reply_text: str, intel: ExtractedIntelligence | None) -> None:
+        """Store a reply, evicting the least recently used entry when full."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (reply_text, intel)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,7 +1,8 @@
 """API module for Sticky-Net."""
 
+from typing import Any
+
 from src.api.schemas import AnalyzeRequest, AnalyzeResponse
-from src.api.middleware import setup_middleware
 
 
 def get_router():
@@ -10,4 +11,17 @@ def get_router():
     return router
 
 
+def __getattr__(name: str) -> Any:
+    """Import the middleware (and with it FastAPI) on first access.
+
+    ``src.api.schemas`` is imported by the detection and extraction modules,
+    which then load this package; keeping FastAPI out of that import keeps
+    their regex fast path and unit tests free of the web stack.
+    """
+    if name == "setup_middleware":
+        from src.api.middleware import setup_middleware
+        return setup_middleware
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["get_router", "AnalyzeRequest", "AnalyzeResponse", "setup_middleware"]
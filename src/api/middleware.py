@@ -6,7 +6,8 @@ from typing import Any
 
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from structlog.contextvars import clear_contextvars
 
 from config.settings import get_settings
 
@@ -72,7 +73,17 @@ class RequestTimingMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class RequestContextMiddleware(BaseHTTPMiddleware):
+    """Middleware to reset the structlog request context."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        """Clear context bound by a previous request before handling this one."""
+        clear_contextvars()
+        return await call_next(request)
+
+
 def setup_middleware(app: FastAPI) -> None:
     """Configure all middleware for the application."""
+    app.add_middleware(RequestContextMiddleware)
     app.add_middleware(RequestTimingMiddleware)
     app.add_middleware(APIKeyMiddleware)
\ No newline at end of file
@@ -1,23 +1,31 @@
 """API route definitions."""
 
 import asyncio
+import logging
 import random
+import re
 import time
 import uuid
+from collections import Counter
+from operator import itemgetter
+from typing import Annotated, Any, cast, get_args
+
 import structlog
-from fastapi import APIRouter, HTTPException, Request
+from structlog.contextvars import bind_contextvars
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 
 from src.api.callback import send_guvi_callback
 from src.api.schemas import (
     AnalyzeRequest,
     AnalyzeResponse,
-    EngagementMetrics,
+    ConversationMessage,
     ErrorResponse,
     ExtractedIntelligence,
     HoneyPotResponse,
-    ScamType,
+    ScamTypeLiteral,
     SenderType,
-    StatusType,
 )
 from src.api.session_store import (
     accumulate_intel as _accumulate_intel,
@@ -27,9 +35,11 @@ from src.api.session_store import (
     store_detection_result,
     get_previous_detection,
 )
-from src.detection.detector import ScamDetector, get_detector
-from src.agents.honeypot_agent import HoneypotAgent, get_agent
-from src.intelligence.extractor import IntelligenceExtractor
+from src.detection.detector import DetectionResult, get_detector
+from src.agents.honeypot_agent import EngagementResult, HoneypotAgent, get_agent
+from src.agents.policy import EngagementMode
+from src.intelligence.extractor import ExtractionResult, get_extractor
+from src.intelligence.validators import ExtractionSource
 from src.exceptions import StickyNetError
 
 logger = structlog.get_logger()
@@ -38,6 +48,27 @@ router = APIRouter(prefix="/api/v1", tags=["analyze"])
 
 # Session state is managed by src.api.session_store (Firestore-backed)
 
+# Conversational replies for messages not detected as scams
+_NORMAL_RESPONSES: tuple[str, ...] = (
+    "Hello! How can I help you today?",
+    "Hi there! Is everything alright?",
+    "Hey! What can I do for you?",
+    "Hello! Yes, I'm here. What's up?",
+    "Hi! I'm listening. What did you want to tell me?",
+)
+
+# In-character replies when the agent exceeds the request budget
+_TIMEOUT_REPLIES: tuple[str, ...] = (
+    "hello... sorry i got disconnected for a moment... what were you saying?",
+    "oh sorry my phone battery low... can you repeat that please?",
+    "sorry beta network problem here... what did you say about my account?",
+    "ji haan... sorry i missed that... can you tell me again please?",
+)
+
+# Shared by both analyze endpoints
+_EMPTY_REPLY_FALLBACK = "Sorry, I'm having trouble understanding. Can you repeat that?"
+_ERROR_REPLY = "Sorry, I'm having trouble right now. Can we talk later?"
+
 
 async def _fire_callback(**kwargs) -> None:
     """Fire-and-forget GUVI callback. Exceptions are silently logged."""
@@ -48,6 +79,168 @@ async def _fire_callback(**kwargs) -> None:
         logger.warning("GUVI callback failed", error=str(e))
 
 
+def _json_response(model: BaseModel) -> Response:
+    """Serialize a response model straight to JSON.
+
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder pass; pydantic-core writes the JSON in one step. The
+    route decorators keep response_model for the OpenAPI schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+# Cheap precursor check: texts without any of these can't yield regex intel
+_INTEL_PREFILTER = re.compile(r"[0-9@]|http", re.IGNORECASE)
+
+# Shared empty intelligence for the no-extraction paths. Never mutated:
+# merges go through model_copy, so one instance replaces 13 list allocations
+# per request
+_EMPTY_INTEL = ExtractedIntelligence()
+
+# Response scam types by detector string; anything else maps to "others"
+_SCAM_TYPES: dict[str, ScamTypeLiteral] = {value: value for value in get_args(ScamTypeLiteral)}
+
+
+def _to_scam_type(scam_type: str | None) -> ScamTypeLiteral | None:
+    """Map a detector scam_type string to a response scam type; unknown values become "others"."""
+    if not scam_type:
+        return None
+    return _SCAM_TYPES.get(scam_type, "others")
+
+
+def _scan_history(
+    history: list[ConversationMessage],
+) -> tuple[list[dict[str, str]], Counter[str]]:
+    """Convert the conversation history for the extractor and count senders.
+
+    Returns:
+        Tuple of (extractor-ready message dicts, message count per sender)
+    """
+    messages = [{"sender": m.sender, "text": m.text} for m in history]
+    # Counter over a C-level itemgetter map counts without a Python-level loop
+    return messages, Counter(map(itemgetter("sender"), messages))
+
+
+async def _regex_extract(messages: list[dict[str, str]]) -> ExtractionResult:
+    """Regex-scan the scammer messages for intelligence.
+
+    Every regex target (phones, accounts, UPI IDs, emails, URLs) needs a digit,
+    an "@" or "http", so when no scammer message has one the scan is skipped.
+    Otherwise it runs off the event loop, since it grows with history and
+    would stall other requests' LLM I/O.
+    """
+    if not any(
+        m["sender"] == SenderType.SCAMMER.value and _INTEL_PREFILTER.search(m["text"])
+        for m in messages
+    ):
+        return ExtractionResult(source=ExtractionSource.REGEX)
+    return await asyncio.to_thread(get_extractor().extract_from_conversation, messages)
+
+
+def _merge_regex_intel(
+    intel: ExtractedIntelligence | None,
+    regex_result: ExtractionResult,
+) -> ExtractedIntelligence:
+    """Fold regex backup finds into (optionally) LLM-validated intelligence.
+
+    Both inputs come from our own extractor, so the result is built without
+    re-running pydantic validation; untouched fields are carried over as-is.
+    """
+    if intel is None:
+        return ExtractedIntelligence.model_construct(
+            bankAccounts=regex_result.bank_accounts,
+            upiIds=regex_result.upi_ids,
+            phoneNumbers=regex_result.phone_numbers,
+            phishingLinks=regex_result.phishing_links,
+            emailAddresses=regex_result.emails,
+        )
+    return intel.model_copy(update={
+        "bankAccounts": list(set(intel.bankAccounts).union(regex_result.bank_accounts)),
+        "upiIds": list(set(intel.upiIds).union(regex_result.upi_ids)),
+        "phoneNumbers": list(set(intel.phoneNumbers).union(regex_result.phone_numbers)),
+        "phishingLinks": list(set(intel.phishingLinks).union(regex_result.phishing_links)),
+        "emailAddresses": list(set(intel.emailAddresses or ()).union(regex_result.emails)),
+    })
+
+
+async def _parse_analyze_request(raw: Request) -> AnalyzeRequest:
+    """Decode and validate the request body in one pydantic-core pass.
+
+    FastAPI would json.loads the body into Python objects and then validate
+    them; model_validate_json does both straight from the raw bytes. Errors
+    are re-raised as RequestValidationError so the app's handler still
+    answers with the 200 fallback reply.
+    """
+    try:
+        return AnalyzeRequest.model_validate_json(await raw.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False, include_context=False)) from e
+
+
+# Dependency-injected body for the analyze endpoints
+ParsedAnalyzeRequest = Annotated[AnalyzeRequest, Depends(_parse_analyze_request)]
+
+
+def _inline_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Model JSON schema with its $defs inlined, for use in openapi_extra."""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def resolve(node: object) -> object:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {k: resolve(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [resolve(v) for v in node]
+        return node
+
+    return cast(dict[str, Any], resolve(schema))
+
+
+# The body is parsed by _parse_analyze_request, so describe it for the docs
+_ANALYZE_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _inline_schema(AnalyzeRequest)}},
+    }
+}
+
+
+async def _detect(session_id: str, request: AnalyzeRequest) -> DetectionResult:
+    """Classify the incoming message with persistent suspicion (Fix 4B).
+
+    The previous result for the session is passed in and the new one is
+    stored, so a session flagged once stays flagged ("once scam, always scam").
+    """
+    # Use singleton detector to avoid per-request genai.Client cold start
+    detection_result = await get_detector().analyze(
+        message=request.message.text,
+        history=request.conversationHistory,
+        metadata=request.metadata,
+        previous_result=get_previous_detection(session_id),
+    )
+    store_detection_result(session_id, detection_result)
+    return detection_result
+
+
+def _render_notes(
+    agent: HoneypotAgent,
+    detection: DetectionResult,
+    engagement_result: EngagementResult,
+    turn_number: int,
+    intel: ExtractedIntelligence,
+) -> str:
+    """Render the agent notes once, with the merged intelligence."""
+    return agent._generate_notes(
+        detection=detection,
+        persona=agent.persona_manager.get_or_create_persona(engagement_result.conversation_id),
+        mode=engagement_result.engagement_mode,
+        turn_number=turn_number,
+        extracted_intel=intel,
+    )
+
+
 @router.post(
     "/analyze",
     response_model=HoneyPotResponse,
@@ -58,8 +251,11 @@ async def _fire_callback(**kwargs) -> None:
         403: {"model": ErrorResponse, "description": "Invalid API key"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
+    openapi_extra=_ANALYZE_REQUEST_BODY,
 )
-async def analyze_message(request: AnalyzeRequest) -> HoneyPotResponse:
+async def analyze_message(
+    request: ParsedAnalyzeRequest,
+) -> Response:
     """
     Analyze incoming message for scam detection and engagement.
 
@@ -70,46 +266,47 @@ async def analyze_message(request: AnalyzeRequest) -> HoneyPotResponse:
     4. Returns simplified response with agent reply
     5. Sends full intelligence to GUVI callback endpoint
     """
+    return _json_response(await _analyze_message(request))
+
+
+async def _analyze_message(request: AnalyzeRequest) -> HoneyPotResponse:
+    """Run the /analyze pipeline and return its response model."""
     # Get or generate session ID
     session_id = request.sessionId or str(uuid.uuid4())
     
     # Track session start time for engagement duration (Firestore-backed)
     init_session_start_time(session_id)
     
-    log = logger.bind(
+    # Request fields ride in the structlog contextvars (cleared per request by
+    # RequestContextMiddleware) instead of a freshly bound logger
+    bind_contextvars(
         channel=request.metadata.channel,
         history_length=len(request.conversationHistory),
         session_id=session_id,
     )
-    log.info("Processing analyze request")
+    logger.info("Processing analyze request")
+    # Skip building verbose diagnostic kwargs when INFO is filtered out
+    info_enabled = logger.is_enabled_for(logging.INFO)
     request_start_time = time.time()  # Track for overall 30s budget
     TOTAL_REQUEST_BUDGET = 26.0  # Hard cap: ensures response reaches client within 30s
 
     # ── Final-turn shortcut: return accumulated intelligence summary ──────────
     # The tester / evaluator sends [CONVERSATION_END] to collect final output.
     if request.message.text.strip() == "[CONVERSATION_END]":
-        log.info("Received CONVERSATION_END – returning accumulated final output")
+        logger.info("Received CONVERSATION_END – returning accumulated final output")
 
         # ── Re-run regex extraction on full history to recover any lost intel ──
         # This is critical when Cloud Run spawns a fresh instance for this request
         # (in-memory session may be empty) — regex will still find intel from msgs.
-        history_messages = [
-            {"sender": m.sender.value if hasattr(m.sender, "value") else str(m.sender), "text": m.text}
-            for m in request.conversationHistory
-        ]
+        history_messages, sender_counts = _scan_history(request.conversationHistory)
+        history_intel = _EMPTY_INTEL
         if history_messages:
-            history_extractor = IntelligenceExtractor()
-            history_regex = history_extractor.extract_from_conversation(history_messages)
+            history_regex = await _regex_extract(history_messages)
             if history_regex.has_intelligence:
-                _accumulate_intel(session_id, ExtractedIntelligence(
-                    bankAccounts=history_regex.bank_accounts,
-                    upiIds=history_regex.upi_ids,
-                    phoneNumbers=history_regex.phone_numbers,
-                    phishingLinks=history_regex.phishing_links,
-                    emailAddresses=history_regex.emails,
-                ))
-
-        accumulated = _accumulate_intel(session_id, ExtractedIntelligence())
+                history_intel = _merge_regex_intel(None, history_regex)
+
+        # Single merge: returns the session totals including the history intel
+        accumulated = _accumulate_intel(session_id, history_intel)
         session_start = get_session_start_time(session_id) or request_start_time
         total_msgs = len(request.conversationHistory) + 1
         engagement_secs = max(int(time.time() - session_start), total_msgs * 25)
@@ -120,10 +317,7 @@ async def analyze_message(request: AnalyzeRequest) -> HoneyPotResponse:
         # Fallback: if detection state was lost (cross-instance) but conversation
         # history shows engagement, we know scam was detected (agent only engages
         # after detection). Use a safe fallback rather than returning False.
-        user_turns_in_history = sum(
-            1 for m in request.conversationHistory
-            if (m.sender.value if hasattr(m.sender, "value") else str(m.sender)) == "user"
-        )
+        user_turns_in_history = sender_counts[SenderType.USER.value]
         if prev_det and prev_det.is_scam:
             scam_detected = True
         elif user_turns_in_history >= 1:
@@ -146,7 +340,7 @@ async def analyze_message(request: AnalyzeRequest) -> HoneyPotResponse:
             f"policyNumbers={len(accumulated.get('policyNumbers',[]))}, "
             f"orderNumbers={len(accumulated.get('orderNumbers',[]))}."
         )
-        return HoneyPotResponse(
+        return HoneyPotResponse.model_construct(
             status="success",
             reply="Thank you for your time. Goodbye.",
             sessionId=session_id,
@@ -161,45 +355,27 @@ async def analyze_message(request: AnalyzeRequest) -> HoneyPotResponse:
 
     try:
         # Step 1: Detect scam (with persistent suspicion — Fix 4B)
-        # Use singleton detector to avoid per-request genai.Client cold start
-        detector = get_detector()
-        previous_detection = get_previous_detection(session_id)
-        detection_result = await detector.analyze(
-            message=request.message.text,
-            history=request.conversationHistory,
-            metadata=request.metadata,
-            previous_result=previous_detection,
-        )
-        # Store for next turn — "once scam, always scam"
-        store_detection_result(session_id, detection_result)
+        detection_result = await _detect(session_id, request)
 
         if not detection_result.is_scam:
-            log.info("Message not detected as scam")
+            logger.info("Message not detected as scam")
             
             # Generate a simple conversational response for non-scam messages
-            normal_responses = [
-                "Hello! How can I help you today?",
-                "Hi there! Is everything alright?",
-                "Hey! What can I do for you?",
-                "Hello! Yes, I'm here. What's up?",
-                "Hi! I'm listening. What did you want to tell me?",
-            ]
-            
-            return HoneyPotResponse(
+            return HoneyPotResponse.model_construct(
                 status="success",
-                reply=random.choice(normal_responses),
+                reply=random.choice(_NORMAL_RESPONSES),
             )
 
-        log.info("Scam detected", confidence=detection_result.confidence)
+        logger.info("Scam detected", confidence=detection_result.confidence)
 
         # Calculate turn number: count scammer messages in history + current message
-        scammer_messages_in_history = sum(
-            1 for m in request.conversationHistory if m.sender == SenderType.SCAMMER
-        )
-        current_turn = scammer_messages_in_history + 1  # +1 for current scammer message
+        # One pass over history: extractor-ready messages + per-sender counts
+        all_messages, sender_counts = _scan_history(request.conversationHistory)
+        all_messages.append({"sender": "scammer", "text": request.message.text})
+        current_turn = sender_counts[SenderType.SCAMMER.value] + 1  # +1 for current scammer message
         
-        # Initialize extractor for validation
-        extractor = IntelligenceExtractor()
+        # Shared extractor for validation (patterns compiled once)
+        extractor = get_extractor()
         
         # NOTE: exit_responses removed (Fix 2A) — we NEVER voluntarily exit.
         # The evaluator controls when the conversation ends (up to 10 turns).
@@ -238,24 +414,18 @@ async def analyze_message(request: AnalyzeRequest) -> HoneyPotResponse:
                     turn_number=current_turn,
                     missing_intel=_missing,
                     extracted_intel=_extracted_dict,
+                    defer_notes=True,  # rendered once below with merged intel
                 ),
                 timeout=agent_budget,
             )
         except asyncio.TimeoutError:
-            log.warning(
+            logger.warning(
                 "Agent timed out, using fallback",
                 elapsed=time.time() - request_start_time,
                 budget=agent_budget,
             )
-            from src.agents.honeypot_agent import EngagementResult, EngagementMode
-            fallback_replies = [
-                "hello... sorry i got disconnected for a moment... what were you saying?",
-                "oh sorry my phone battery low... can you repeat that please?",
-                "sorry beta network problem here... what did you say about my account?",
-                "ji haan... sorry i missed that... can you tell me again please?",
-            ]
             engagement_result = EngagementResult(
-                response=random.choice(fallback_replies),
+                response=random.choice(_TIMEOUT_REPLIES),
                 duration_seconds=int(time.time() - request_start_time),
                 notes="Agent timed out; fallback response used",
                 conversation_id=str(uuid.uuid4()),
@@ -266,7 +436,7 @@ async def analyze_message(request: AnalyzeRequest) -> HoneyPotResponse:
             )
 
         # Log the raw agent response for debugging
-        log.info(
+        logger.info(
             "Agent engagement complete",
             agent_response=engagement_result.response if engagement_result.response else None,
             has_extracted_intel=engagement_result.extracted_intelligence is not None,
@@ -276,98 +446,62 @@ async def analyze_message(request: AnalyzeRequest) -> HoneyPotResponse:
         if engagement_result.extracted_intelligence:
             # AI extracted intelligence - validate it
             validated_intel = extractor.validate_llm_extraction(engagement_result.extracted_intelligence)
-            log.info(
-                "AI extraction validated",
-                bank_accounts=len(validated_intel.bankAccounts),
-                upi_ids=len(validated_intel.upiIds),
-                phone_numbers=len(validated_intel.phoneNumbers),
-                beneficiary_names=len(validated_intel.beneficiaryNames),
-                ifsc_codes=len(validated_intel.ifscCodes),
-                urls=len(validated_intel.phishingLinks),
-                case_ids=len(validated_intel.caseIds),
-                policy_numbers=len(validated_intel.policyNumbers),
-                order_numbers=len(validated_intel.orderNumbers),
-            )
+            if info_enabled:
+                logger.info(
+                    "AI extraction validated",
+                    bank_accounts=len(validated_intel.bankAccounts),
+                    upi_ids=len(validated_intel.upiIds),
+                    phone_numbers=len(validated_intel.phoneNumbers),
+                    beneficiary_names=len(validated_intel.beneficiaryNames),
+                    ifsc_codes=len(validated_intel.ifscCodes),
+                    urls=len(validated_intel.phishingLinks),
+                    case_ids=len(validated_intel.caseIds),
+                    policy_numbers=len(validated_intel.policyNumbers),
+                    order_numbers=len(validated_intel.orderNumbers),
+                )
         else:
-            # No AI extraction - return empty
-            validated_intel = ExtractedIntelligence()
-            log.warning("No AI extraction available")
+            # No AI extraction - return empty (shared read-only instance)
+            validated_intel = _EMPTY_INTEL
+            logger.warning("No AI extraction available")
 
         # Step 3b: Regex backup extraction from scammer messages
         # Scan the current scammer message + all history scammer messages
-        all_messages = [
-            {"sender": m.sender.value if hasattr(m.sender, 'value') else str(m.sender), "text": m.text}
-            for m in request.conversationHistory
-        ]
-        all_messages.append({"sender": "scammer", "text": request.message.text})
-        
-        regex_result = extractor.extract_from_conversation(all_messages)
+        regex_result = await _regex_extract(all_messages)
         
         if regex_result.has_intelligence:
-            log.info(
-                "Regex backup found additional intel",
-                phones=len(regex_result.phone_numbers),
-                accounts=len(regex_result.bank_accounts),
-                upi=len(regex_result.upi_ids),
-                urls=len(regex_result.phishing_links),
-                emails=len(regex_result.emails),
-            )
+            if info_enabled:
+                logger.info(
+                    "Regex backup found additional intel",
+                    phones=len(regex_result.phone_numbers),
+                    accounts=len(regex_result.bank_accounts),
+                    upi=len(regex_result.upi_ids),
+                    urls=len(regex_result.phishing_links),
+                    emails=len(regex_result.emails),
+                )
             # Merge regex finds into validated_intel
-            merged_accounts = list(set(validated_intel.bankAccounts + regex_result.bank_accounts))
-            merged_upi = list(set(validated_intel.upiIds + regex_result.upi_ids))
-            merged_phones = list(set(validated_intel.phoneNumbers + regex_result.phone_numbers))
-            merged_links = list(set(validated_intel.phishingLinks + regex_result.phishing_links))
-            merged_emails = list(set((validated_intel.emailAddresses or []) + regex_result.emails))
-            
-            validated_intel = ExtractedIntelligence(
-                bankAccounts=merged_accounts,
-                upiIds=merged_upi,
-                phoneNumbers=merged_phones,
-                phishingLinks=merged_links,
-                emailAddresses=merged_emails,
-                beneficiaryNames=validated_intel.beneficiaryNames,
-                bankNames=validated_intel.bankNames,
-                ifscCodes=validated_intel.ifscCodes,
-                whatsappNumbers=validated_intel.whatsappNumbers,
-                suspiciousKeywords=validated_intel.suspiciousKeywords,
-                caseIds=validated_intel.caseIds,
-                policyNumbers=validated_intel.policyNumbers,
-                orderNumbers=validated_intel.orderNumbers,
-            )
+            validated_intel = _merge_regex_intel(validated_intel, regex_result)
 
         # Step 4: Log intelligence status (never exit voluntarily — Fix 2A)
-        log.info(
-            "Intelligence status (no early exit)",
-            bank_accounts=len(validated_intel.bankAccounts),
-            phone_numbers=len(validated_intel.phoneNumbers),
-            upi_ids=len(validated_intel.upiIds),
-            beneficiary_names=len(validated_intel.beneficiaryNames),
-            turn=current_turn,
-        )
+        if info_enabled:
+            logger.info(
+                "Intelligence status (no early exit)",
+                bank_accounts=len(validated_intel.bankAccounts),
+                phone_numbers=len(validated_intel.phoneNumbers),
+                upi_ids=len(validated_intel.upiIds),
+                beneficiary_names=len(validated_intel.beneficiaryNames),
+                turn=current_turn,
+            )
 
         # Step 5: Build response
-        # Convert scam_type string to ScamType enum
-        scam_type_enum = None
-        if detection_result.scam_type:
-            try:
-                scam_type_enum = ScamType(detection_result.scam_type)
-            except ValueError:
-                scam_type_enum = ScamType.OTHERS
-        
         # Ensure agentResponse is never None
         agent_response = engagement_result.response
         if not agent_response:
-            agent_response = "Sorry, I'm having trouble understanding. Can you repeat that?"
-            log.warning("Agent response was None, using fallback")
+            agent_response = _EMPTY_REPLY_FALLBACK
+            logger.warning("Agent response was None, using fallback")
         
-        # Generate agent notes with validated intelligence
-        agent_singleton = get_agent()
-        final_notes = agent_singleton._generate_notes(
-            detection=detection_result,
-            persona=agent_singleton.persona_manager.get_or_create_persona(engagement_result.conversation_id),
-            mode=engagement_result.engagement_mode,
-            turn_number=current_turn,
-            extracted_intel=validated_intel,
+        # Generate agent notes once, with the merged intelligence
+        final_notes = _render_notes(
+            agent, detection_result, engagement_result, current_turn, validated_intel
         )
         
         # Calculate totalMessagesExchanged: history + current message + agent reply
@@ -397,22 +531,22 @@ async def analyze_message(request: AnalyzeRequest) -> HoneyPotResponse:
         ))
         
         # Return simplified response to hackathon platform
-        return HoneyPotResponse(
+        return HoneyPotResponse.model_construct(
             status="success",
             reply=agent_response,
         )
 
     except StickyNetError as e:
-        log.error("Application error", error=str(e))
+        logger.error("Application error", error=str(e))
         return HoneyPotResponse(
             status="error",
-            reply="Sorry, I'm having trouble right now. Can we talk later?",
+            reply=_ERROR_REPLY,
         )
     except Exception as e:
-        log.exception("Unexpected error")
+        logger.exception("Unexpected error")
         return HoneyPotResponse(
             status="error",
-            reply="Sorry, I'm having trouble right now. Can we talk later?",
+            reply=_ERROR_REPLY,
         )
 
 
@@ -424,8 +558,11 @@ async def analyze_message(request: AnalyzeRequest) -> HoneyPotResponse:
         400: {"model": ErrorResponse, "description": "Invalid request"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
+    openapi_extra=_ANALYZE_REQUEST_BODY,
 )
-async def analyze_message_detailed(request: AnalyzeRequest) -> AnalyzeResponse:
+async def analyze_message_detailed(
+    request: ParsedAnalyzeRequest,
+) -> Response:
     """
     Analyze incoming message with full response details.
     
@@ -436,50 +573,49 @@ async def analyze_message_detailed(request: AnalyzeRequest) -> AnalyzeResponse:
     
     Intended for frontend demo/testing, not for hackathon evaluation.
     """
+    return _json_response(await _analyze_message_detailed(request))
+
+
+async def _analyze_message_detailed(request: AnalyzeRequest) -> AnalyzeResponse:
+    """Run the /analyze/detailed pipeline and return its response model."""
     session_id = request.sessionId or str(uuid.uuid4())
 
     # Track session start time for engagement duration
     init_session_start_time(session_id)
     
-    log = logger.bind(
+    # Request fields ride in the structlog contextvars (cleared per request by
+    # RequestContextMiddleware) instead of a freshly bound logger
+    bind_contextvars(
         channel=request.metadata.channel,
         history_length=len(request.conversationHistory),
         session_id=session_id,
     )
-    log.info("Processing detailed analyze request")
+    logger.info("Processing detailed analyze request")
+    # Skip building verbose diagnostic kwargs when INFO is filtered out
+    info_enabled = logger.is_enabled_for(logging.INFO)
 
     try:
         # Step 1: Detect scam (with persistent suspicion — Fix 4B)
-        detector = get_detector()
-        previous_detection = get_previous_detection(session_id)
-        detection_result = await detector.analyze(
-            message=request.message.text,
-            history=request.conversationHistory,
-            metadata=request.metadata,
-            previous_result=previous_detection,
-        )
-        # Store for next turn — "once scam, always scam"
-        store_detection_result(session_id, detection_result)
+        detection_result = await _detect(session_id, request)
 
         if not detection_result.is_scam:
-            log.info("Message not detected as scam")
-            return AnalyzeResponse(
-                status=StatusType.SUCCESS,
+            logger.info("Message not detected as scam")
+            return AnalyzeResponse.construct_trusted(
+                status="success",
                 scamDetected=False,
                 confidence=detection_result.confidence,
                 agentResponse="Hello! How can I help you today?",
             )
 
-        log.info("Scam detected", confidence=detection_result.confidence)
+        logger.info("Scam detected", confidence=detection_result.confidence)
 
         # Calculate turn number
-        scammer_messages_in_history = sum(
-            1 for m in request.conversationHistory if m.sender == SenderType.SCAMMER
-        )
-        current_turn = scammer_messages_in_history + 1
+        all_messages, sender_counts = _scan_history(request.conversationHistory)
+        all_messages.append({"sender": "scammer", "text": request.message.text})
+        current_turn = sender_counts[SenderType.SCAMMER.value] + 1
 
-        # Initialize extractor
-        extractor = IntelligenceExtractor()
+        # Shared extractor
+        extractor = get_extractor()
 
         # Step 2: Engage with AI agent
         agent = get_agent()
@@ -489,73 +625,39 @@ async def analyze_message_detailed(request: AnalyzeRequest) -> AnalyzeResponse:
             metadata=request.metadata,
             detection=detection_result,
             turn_number=current_turn,
+            defer_notes=True,  # rendered once below with merged intel
         )
 
         # Step 3: Validate AI extraction
         if engagement_result.extracted_intelligence:
             validated_intel = extractor.validate_llm_extraction(engagement_result.extracted_intelligence)
         else:
-            validated_intel = ExtractedIntelligence()
+            validated_intel = _EMPTY_INTEL
 
         # Step 3b: Regex backup extraction from scammer messages
         # (Same as /analyze endpoint — ensures fakeData like bank accounts,
         #  phishing links, and emails are captured even when the LLM misses them)
-        all_messages = [
-            {"sender": m.sender.value if hasattr(m.sender, 'value') else str(m.sender), "text": m.text}
-            for m in request.conversationHistory
-        ]
-        all_messages.append({"sender": "scammer", "text": request.message.text})
-
-        regex_result = extractor.extract_from_conversation(all_messages)
+        regex_result = await _regex_extract(all_messages)
 
         if regex_result.has_intelligence:
-            log.info(
-                "Regex backup found additional intel (detailed)",
-                phones=len(regex_result.phone_numbers),
-                accounts=len(regex_result.bank_accounts),
-                upi=len(regex_result.upi_ids),
-                urls=len(regex_result.phishing_links),
-                emails=len(regex_result.emails),
-            )
-            merged_accounts = list(set(validated_intel.bankAccounts + regex_result.bank_accounts))
-            merged_upi = list(set(validated_intel.upiIds + regex_result.upi_ids))
-            merged_phones = list(set(validated_intel.phoneNumbers + regex_result.phone_numbers))
-            merged_links = list(set(validated_intel.phishingLinks + regex_result.phishing_links))
-            merged_emails = list(set((validated_intel.emailAddresses or []) + regex_result.emails))
-
-            validated_intel = ExtractedIntelligence(
-                bankAccounts=merged_accounts,
-                upiIds=merged_upi,
-                phoneNumbers=merged_phones,
-                phishingLinks=merged_links,
-                emailAddresses=merged_emails,
-                beneficiaryNames=validated_intel.beneficiaryNames,
-                bankNames=validated_intel.bankNames,
-                ifscCodes=validated_intel.ifscCodes,
-                whatsappNumbers=validated_intel.whatsappNumbers,
-                suspiciousKeywords=validated_intel.suspiciousKeywords,
-                caseIds=validated_intel.caseIds,
-                policyNumbers=validated_intel.policyNumbers,
-                orderNumbers=validated_intel.orderNumbers,
-            )
+            if info_enabled:
+                logger.info(
+                    "Regex backup found additional intel (detailed)",
+                    phones=len(regex_result.phone_numbers),
+                    accounts=len(regex_result.bank_accounts),
+                    upi=len(regex_result.upi_ids),
+                    urls=len(regex_result.phishing_links),
+                    emails=len(regex_result.emails),
+                )
+            validated_intel = _merge_regex_intel(validated_intel, regex_result)
 
         # Step 4: Build full response
-        scam_type_enum = None
-        if detection_result.scam_type:
-            try:
-                scam_type_enum = ScamType(detection_result.scam_type)
-            except ValueError:
-                scam_type_enum = ScamType.OTHERS
-
-        agent_response = engagement_result.response or "Sorry, I'm having trouble understanding. Can you repeat that?"
+        scam_type_enum = _to_scam_type(detection_result.scam_type)
+
+        agent_response = engagement_result.response or _EMPTY_REPLY_FALLBACK
         
-        agent_singleton = get_agent()
-        final_notes = agent_singleton._generate_notes(
-            detection=detection_result,
-            persona=agent_singleton.persona_manager.get_or_create_persona(engagement_result.conversation_id),
-            mode=engagement_result.engagement_mode,
-            turn_number=current_turn,
-            extracted_intel=validated_intel,
+        final_notes = _render_notes(
+            agent, detection_result, engagement_result, current_turn, validated_intel
         )
 
         total_messages_exchanged = len(request.conversationHistory) + 2
@@ -565,25 +667,26 @@ async def analyze_message_detailed(request: AnalyzeRequest) -> AnalyzeResponse:
         session_start = get_session_start_time(session_id) or time.time()
         engagement_duration = max(int(time.time() - session_start), current_turn * 25)
 
-        return AnalyzeResponse(
-            status=StatusType.SUCCESS,
+        # All fields come from our own pipeline, so skip re-validation
+        return AnalyzeResponse.construct_trusted(
+            status="success",
             scamDetected=True,
             scamType=scam_type_enum,
             confidence=detection_result.confidence,
-            engagementMetrics=EngagementMetrics(
-                engagementDurationSeconds=engagement_duration,
-                totalMessagesExchanged=total_messages_exchanged,
-            ),
+            engagementMetrics={
+                "engagementDurationSeconds": engagement_duration,
+                "totalMessagesExchanged": total_messages_exchanged,
+            },
             extractedIntelligence=validated_intel,
             agentNotes=final_notes,
             agentResponse=agent_response,
         )
 
     except Exception as e:
-        log.exception("Unexpected error in detailed endpoint")
+        logger.exception("Unexpected error in detailed endpoint")
         return AnalyzeResponse(
-            status=StatusType.ERROR,
+            status="error",
             scamDetected=False,
-            agentResponse="Sorry, I'm having trouble right now. Can we talk later?",
+            agentResponse=_ERROR_REPLY,
             agentNotes=f"Error: {str(e)}",
         )
\ No newline at end of file
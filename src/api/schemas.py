@@ -2,9 +2,9 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Annotated, Union
+from typing import Annotated, Any, Literal, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
 
 class SenderType(str, Enum):
@@ -23,11 +23,24 @@ class ChannelType(str, Enum):
     CHAT = "Chat"
 
 
+# Bounds for Message.text (increased limit for long scam messages)
+MESSAGE_TEXT_MIN_LENGTH = 1
+MESSAGE_TEXT_MAX_LENGTH = 10000
+
+
 class Message(BaseModel):
-    """Incoming message model."""
+    """Incoming message model.
+
+    ``text`` length is enforced once per request by
+    ``AnalyzeRequest.model_post_init`` rather than by a constrained-str
+    validator; the bounds stay in the schema.
+    """
 
     sender: str  # Accept any sender identifier
-    text: Annotated[str, Field(min_length=1, max_length=10000)]  # Increased limit for long scam messages
+    text: Annotated[
+        str,
+        Field(json_schema_extra={"minLength": MESSAGE_TEXT_MIN_LENGTH, "maxLength": MESSAGE_TEXT_MAX_LENGTH}),
+    ]
     timestamp: Union[int, str, datetime]  # Accept epoch ms (int), ISO string, or datetime
 
     @field_validator("timestamp", mode="before")
@@ -80,6 +93,15 @@ class ConversationMessage(BaseModel):
                 return datetime.fromisoformat(v)
         raise ValueError(f"Invalid timestamp format: {v}")
 
+    @classmethod
+    def make(cls, sender: str, text: str, timestamp: datetime) -> "ConversationMessage":
+        """Build a history message from server-side values without validation.
+
+        Use this when internal code appends to a conversation (e.g. our own
+        agent replies); ``timestamp`` must already be a datetime.
+        """
+        return cls.model_construct(sender=sender, text=text, timestamp=timestamp)
+
 
 class Metadata(BaseModel):
     """Request metadata."""
@@ -97,6 +119,21 @@ class AnalyzeRequest(BaseModel):
     metadata: Metadata = Field(default_factory=Metadata)
     sessionId: str | None = None  # Optional session ID for multi-turn tracking
 
+    def model_post_init(self, context: Any, /) -> None:
+        """Check the message text length with one ``len()`` after validation."""
+        text = self.message.text
+        length = len(text)
+        if length < MESSAGE_TEXT_MIN_LENGTH:
+            error_type, ctx = "string_too_short", {"min_length": MESSAGE_TEXT_MIN_LENGTH}
+        elif length > MESSAGE_TEXT_MAX_LENGTH:
+            error_type, ctx = "string_too_long", {"max_length": MESSAGE_TEXT_MAX_LENGTH}
+        else:
+            return
+        raise ValidationError.from_exception_data(
+            type(self).__name__,
+            [{"type": error_type, "loc": ("message", "text"), "input": text, "ctx": ctx}],
+        )
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -128,6 +165,10 @@ class EngagementMetrics(BaseModel):
 class ExtractedIntelligence(BaseModel):
     """Extracted intelligence model."""
 
+    # Frozen: instances are shared (e.g. the routes' empty default) and merges
+    # build new ones via model_copy, so fields are never reassigned
+    model_config = {"frozen": True}
+
     bankAccounts: list[str] = Field(default_factory=list)
     upiIds: list[str] = Field(default_factory=list)
     phoneNumbers: list[str] = Field(default_factory=list)
@@ -169,18 +210,60 @@ class ScamType(str, Enum):
     OTHERS = "others"
 
 
+# Literal forms of StatusType / ScamType for response fields: pydantic-core
+# checks a Literal with a set lookup instead of an Enum member conversion
+StatusLiteral = Literal["success", "error"]
+ScamTypeLiteral = Literal["job_offer", "banking_fraud", "lottery_reward", "impersonation", "others"]
+
+
 class AnalyzeResponse(BaseModel):
     """Main API response model."""
 
-    status: StatusType = StatusType.SUCCESS
+    status: StatusLiteral = "success"
     scamDetected: bool
-    scamType: ScamType | None = None  # Type of scam detected
+    scamType: ScamTypeLiteral | None = None  # Type of scam detected
     confidence: float = 0.0  # Detection confidence (0.0 to 1.0)
     engagementMetrics: EngagementMetrics = Field(default_factory=EngagementMetrics)
     extractedIntelligence: ExtractedIntelligence = Field(default_factory=ExtractedIntelligence)
     agentNotes: str = ""
     agentResponse: str | None = None  # The response to send back to the scammer
 
+    @classmethod
+    def construct_trusted(
+        cls,
+        *,
+        scamDetected: bool,
+        status: StatusLiteral = "success",
+        scamType: ScamTypeLiteral | None = None,
+        confidence: float = 0.0,
+        engagementMetrics: EngagementMetrics | dict[str, Any] | None = None,
+        extractedIntelligence: ExtractedIntelligence | dict[str, Any] | None = None,
+        agentNotes: str = "",
+        agentResponse: str | None = None,
+    ) -> "AnalyzeResponse":
+        """Build a response from server-computed values without validation.
+
+        Nested ``engagementMetrics`` / ``extractedIntelligence`` may be given
+        as dicts; they are constructed (not validated) as well. Only use this
+        for data produced by our own pipeline, never for client input.
+        """
+        if not isinstance(engagementMetrics, EngagementMetrics):
+            engagementMetrics = EngagementMetrics.model_construct(**(engagementMetrics or {}))
+        if not isinstance(extractedIntelligence, ExtractedIntelligence):
+            extractedIntelligence = ExtractedIntelligence.model_construct(
+                **(extractedIntelligence or {})
+            )
+        return cls.model_construct(
+            status=status,
+            scamDetected=scamDetected,
+            scamType=scamType,
+            confidence=confidence,
+            engagementMetrics=engagementMetrics,
+            extractedIntelligence=extractedIntelligence,
+            agentNotes=agentNotes,
+            agentResponse=agentResponse,
+        )
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -215,7 +298,7 @@ class AnalyzeResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Error response model."""
 
-    status: StatusType = StatusType.ERROR
+    status: StatusLiteral = "error"
     error: str
     detail: str | None = None
 
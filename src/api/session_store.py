@@ -160,6 +160,17 @@ def set_session_classification(session_id: str, classification: Any) -> None:
 _DETECTIONS: dict[str, Any] = {}
 
 
+class _RestoredDetection:
+    """Minimal detection result rebuilt from a Firestore document."""
+
+    __slots__ = ("confidence", "is_scam", "scam_type")
+
+    def __init__(self, is_scam: bool, scam_type: str, confidence: float) -> None:
+        self.is_scam = is_scam
+        self.scam_type = scam_type
+        self.confidence = confidence
+
+
 def store_detection_result(session_id: str, result: Any) -> None:
     """Store last detection result for persistent suspicion (in-memory + Firestore)."""
     _DETECTIONS[session_id] = result
@@ -192,11 +203,11 @@ def get_previous_detection(session_id: str) -> Any | None:
                 data = doc.to_dict()
                 if data.get("detection_is_scam"):
                     # Reconstruct a minimal detection result object
-                    class _DetResult:
-                        is_scam = bool(data.get("detection_is_scam", False))
-                        scam_type = data.get("detection_scam_type") or "banking_fraud"
-                        confidence = float(data.get("detection_confidence", 0.85))
-                    restored = _DetResult()
+                    restored = _RestoredDetection(
+                        is_scam=bool(data.get("detection_is_scam", False)),
+                        scam_type=data.get("detection_scam_type") or "banking_fraud",
+                        confidence=float(data.get("detection_confidence", 0.85)),
+                    )
                     _DETECTIONS[session_id] = restored
                     return restored
         except Exception as exc:
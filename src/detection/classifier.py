@@ -1,17 +1,43 @@
 """AI-based scam classification using Gemini 3 Flash."""
 
 import asyncio
-import json
+import contextvars
 import os
+import string
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
+import orjson
 import structlog
-from google import genai
-from google.genai import types
+from pydantic import BaseModel
 
 from config.settings import get_settings
-from src.api.schemas import ConversationMessage, Metadata
+from src.api.schemas import ConversationMessage, Metadata, ScamTypeLiteral
+from src.hedging import hedged_call
+
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Gemini SDK on first access and not at module import.
+
+    google.genai is slow to import, so it is only loaded once a classifier is
+    built; ``classifier.genai`` / ``classifier.types`` still resolve (e.g. for
+    patching in tests).
+    """
+    if name == "genai":
+        from google import genai
+        return genai
+    if name == "types":
+        from google.genai import types
+        return types
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ScamType(str, Enum):
@@ -26,7 +52,7 @@ class ScamType(str, Enum):
 logger = structlog.get_logger()
 
 
-def _extract_text_from_response(response) -> str:
+def _extract_text_from_response(response: "types.GenerateContentResponse") -> str:
     """Extract text from Gemini response without triggering thought_signature warning.
     
     Gemini 3 models return 'thought_signature' parts alongside text parts.
@@ -52,28 +78,101 @@ def _extract_text_from_response(response) -> str:
     return "".join(text_parts)
 
 
-# Safety settings for Gemini to allow scam content analysis (for honeypot context)
-CLASSIFIER_SAFETY_SETTINGS = [
-    types.SafetySetting(
-        category=types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-        threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH,
-    ),
-    types.SafetySetting(
-        category=types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-        threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH,
-    ),
-    types.SafetySetting(
-        category=types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-        threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH,
-    ),
-    types.SafetySetting(
-        category=types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-        threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH,
-    ),
-]
-
-
-@dataclass
+@lru_cache(maxsize=4)
+def _get_client(vertexai: bool, project: str, location: str) -> "genai.Client":
+    """Return a shared Gemini client for the given Vertex AI target.
+
+    Classifier instances reuse one client (and its connection pool) instead
+    of each paying client construction and fresh TLS handshakes.
+    """
+    from google import genai
+
+    return genai.Client(vertexai=vertexai, project=project, location=location)
+
+
+def _build_safety_settings(types: ModuleType) -> "list[types.SafetySetting]":
+    """Safety settings for Gemini to allow scam content analysis (for honeypot context)."""
+    return [
+        types.SafetySetting(
+            category=types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+            threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH,
+        ),
+        types.SafetySetting(
+            category=types.HarmCategory.HARM_CATEGORY_HARASSMENT,
+            threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH,
+        ),
+        types.SafetySetting(
+            category=types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+            threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH,
+        ),
+        types.SafetySetting(
+            category=types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+            threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH,
+        ),
+    ]
+
+
+def _split_literals(
+    parsed: Iterable[tuple[str, str | None, str | None, str | None]],
+) -> list[list[str]]:
+    """Group ``string.Formatter().parse`` literals into the runs between fields.
+
+    Escaped braces (``{{``) split a literal into several parsed chunks, so the
+    chunks are collected per run rather than taken one per tuple.
+    """
+    runs: list[list[str]] = [[]]
+    for literal, field_name, _, _ in parsed:
+        runs[-1].append(literal)
+        if field_name is not None:
+            runs.append([])
+    return runs
+
+
+def _make_prompt_builder(segments: tuple[str, ...]) -> Callable[[str, str, str, str, str], str]:
+    """Return a function that fills CLASSIFICATION_PROMPT (fields in template order).
+
+    The six literal segments live in closure cells, so a call is one f-string
+    build with no attribute lookups or tuple unpacking.
+    """
+    s0, s1, s2, s3, s4, s5 = segments
+
+    def build_prompt(
+        history: str,
+        message: str,
+        channel: str,
+        locale: str,
+        previous_assessment: str,
+    ) -> str:
+        return f"{s0}{history}{s1}{message}{s2}{channel}{s3}{locale}{s4}{previous_assessment}{s5}"
+
+    return build_prompt
+
+
+@lru_cache(maxsize=128)
+def _format_history_window(window: tuple[tuple[str, str], ...]) -> str:
+    """Render (sender, text) pairs as prompt history lines.
+
+    Keyed on message content rather than object identity: every request
+    parses fresh message objects, so ids would be reused across conversations.
+    Retried requests and scripted campaigns replaying the same history hit it.
+    """
+    # sender is a plain str (schemas coerce SenderType to its value)
+    return "\n".join(
+        f"[{'SCAMMER' if sender == 'scammer' else 'USER'}]: {text}" for sender, text in window
+    )
+
+
+class _ClassificationSchema(BaseModel):
+    """Structured-output schema sent to Gemini (mirrors ClassificationResult)."""
+
+    is_scam: bool
+    confidence: float
+    scam_type: ScamTypeLiteral | None
+    threat_indicators: list[str]
+    reasoning: str
+
+
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of AI scam classification."""
 
@@ -82,6 +181,11 @@ class ClassificationResult:
     scam_type: str | None = None
     threat_indicators: list[str] = field(default_factory=list)
     reasoning: str = ""
+    failed: bool = False  # True when the verdict is a fallback, not a model answer
+
+
+# Queued prompt and the future its classify() call is waiting on
+_BatchItem = tuple[str, asyncio.Future[ClassificationResult | None]]
 
 
 class ScamClassifier:
@@ -111,27 +215,68 @@ SCAM TYPES: "job_offer" | "banking_fraud" | "lottery_reward" | "impersonation" |
 Return ONLY: {{"is_scam": bool, "confidence": float, "scam_type": str|null, "threat_indicators": [str], "reasoning": "brief"}}
 """
 
+    BATCH_PROMPT_HEADER = """You will classify {count} independent requests. Each request below is
+self-contained; apply its instructions to it alone.
+
+Return ONLY a JSON array of exactly {count} result objects, in request order.
+
+"""
+
+    # Literal text between the prompt's fields, split once so each request
+    # stitches them with an f-string instead of re-parsing the format spec
+    _PROMPT_SEGMENTS: tuple[str, ...] = tuple(
+        "".join(parts)
+        for parts in _split_literals(string.Formatter().parse(CLASSIFICATION_PROMPT))
+    )
+    _build_prompt = staticmethod(_make_prompt_builder(_PROMPT_SEGMENTS))
+
     def __init__(self) -> None:
         """Initialize the classifier with Gemini 3 Flash and fallback to 2.5."""
+        # Deferred SDK import (see module __getattr__)
+        from google.genai import types
+
         self.settings = get_settings()
         
         # Set credentials path in environment if configured
         if self.settings.google_application_credentials:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = self.settings.google_application_credentials
         
-        # Initialize Gemini client with Vertex AI credentials from settings
-        self.client = genai.Client(
-            vertexai=self.settings.google_genai_use_vertexai,
-            project=self.settings.google_cloud_project,
-            location=self.settings.google_cloud_location,
+        # Shared Gemini client with Vertex AI credentials from settings
+        self.client = _get_client(
+            self.settings.google_genai_use_vertexai,
+            self.settings.google_cloud_project,
+            self.settings.google_cloud_location,
         )
         
         # Primary model (Gemini 3 Flash) and fallback (Gemini 2.5 Flash)
         self.model = self.settings.flash_model  # gemini-3-flash-preview
         self.fallback_model = self.settings.fallback_flash_model  # gemini-2.5-flash
         self._last_model_used: str | None = None  # Track which model was used
+        self._hedge_delay = self.settings.gemini_hedge_delay_seconds
+        # Micro-batching state; the worker starts on first use (needs a running loop)
+        self._batch_window = self.settings.classifier_batch_window_ms / 1000
+        self._batch_max = max(1, self.settings.classifier_batch_max)
+        self._batch_queue: asyncio.Queue[_BatchItem] | None = None
+        self._batch_worker: asyncio.Task[None] | None = None
+        self._batch_loop: asyncio.AbstractEventLoop | None = None
+        self._batch_runs: set[asyncio.Task[None]] = set()  # strong refs until each batch finishes
         self.logger = logger.bind(component="ScamClassifier")
 
+        # Same for every call and retry, so built once
+        # Thinking set to MINIMAL for fast classification
+        self._safety_settings = _build_safety_settings(types)
+        self._config = types.GenerateContentConfig(
+            temperature=0.1,  # Low temperature for consistent classification
+            safety_settings=self._safety_settings,
+            max_output_tokens=1024,
+            thinking_config=types.ThinkingConfig(
+                thinking_budget=0,
+            ),
+            # Constrained decoding: replies are always bare JSON in this shape
+            response_mime_type="application/json",
+            response_schema=_ClassificationSchema,
+        )
+
     async def classify(
         self,
         message: str,
@@ -165,14 +310,20 @@ Return ONLY: {{"is_scam": bool, "confidence": float, "scam_type": str|null, "thr
             )
 
         # Build prompt
-        prompt = self.CLASSIFICATION_PROMPT.format(
-            history=history_text,
-            message=message,
-            channel=metadata.channel if metadata else "unknown",
-            locale=metadata.locale if metadata else "unknown",
-            previous_assessment=prev_text,
+        prompt = self._build_prompt(
+            history_text,
+            message,
+            metadata.channel if metadata else "unknown",
+            metadata.locale if metadata else "unknown",
+            prev_text,
         )
 
+        if self._batch_window > 0:
+            # None means the batch failed: classify on our own below
+            batched = await self._classify_batched(prompt)
+            if batched is not None:
+                return batched
+
         try:
             # Try primary model (Gemini 3 Flash) first, then fallback (Gemini 2.5 Flash)
             models_to_try = [self.model, self.fallback_model]
@@ -181,42 +332,40 @@ Return ONLY: {{"is_scam": bool, "confidence": float, "scam_type": str|null, "thr
             max_retries = self.settings.gemini_max_retries
             retry_delay = self.settings.gemini_retry_delay_seconds
             
+            if self._hedge_delay > 0:
+                # Hedged mode replaces the sequential loop below
+                hedged = await hedged_call(
+                    lambda model_name: self._call_model(model_name, prompt, timeout_seconds),
+                    self.model,
+                    self.fallback_model,
+                    self._hedge_delay,
+                    self.logger,
+                )
+                if hedged is not None:
+                    self._last_model_used, response_text = hedged
+                    self.logger.info(
+                        "Classification successful",
+                        model=self._last_model_used,
+                        response_length=len(response_text),
+                        hedged=True,
+                    )
+                models_to_try = []
+
+            # Per-call constants bound once; log lines below add only what varies.
+            # Event names are static so nothing is formatted for filtered levels
+            attempt_logger = self.logger.bind(max_retries=max_retries, timeout_seconds=timeout_seconds)
+
             for model_name in models_to_try:
                 # Retry loop for timeout handling
                 for attempt in range(max_retries + 1):
                     try:
-                        self.logger.debug(
-                            f"Trying classification model: {model_name}",
+                        attempt_logger.debug(
+                            "Trying classification model",
+                            model=model_name,
                             attempt=attempt + 1,
-                            max_retries=max_retries,
-                            timeout=timeout_seconds,
-                        )
-                        
-                        # Thinking set to MINIMAL for fast classification
-                        config = types.GenerateContentConfig(
-                            temperature=0.1,  # Low temperature for consistent classification
-                            safety_settings=CLASSIFIER_SAFETY_SETTINGS,
-                            max_output_tokens=1024,
-                            thinking_config=types.ThinkingConfig(
-                                thinking_budget=0,
-                            ),
-                        )
-                        
-                        # Wrap API call with timeout (async with executor)
-                        response = await asyncio.wait_for(
-                            asyncio.get_event_loop().run_in_executor(
-                                None,
-                                lambda: self.client.models.generate_content(
-                                    model=model_name,
-                                    contents=prompt,
-                                    config=config,
-                                )
-                            ),
-                            timeout=timeout_seconds,
                         )
                         
-                        # Use helper to avoid thought_signature warning in Gemini 3
-                        response_text = _extract_text_from_response(response)
+                        response_text = await self._call_model(model_name, prompt, timeout_seconds)
                         
                         # Check if we got a valid response
                         if response_text and len(response_text.strip()) > 0:
@@ -236,15 +385,15 @@ Return ONLY: {{"is_scam": bool, "confidence": float, "scam_type": str|null, "thr
                             break  # Don't retry on empty response, try fallback model
                             
                     except asyncio.TimeoutError:
-                        self.logger.warning(
+                        attempt_logger.warning(
                             "Gemini API timeout during classification",
                             model=model_name,
                             attempt=attempt + 1,
-                            timeout_seconds=timeout_seconds,
                         )
                         if attempt < max_retries:
-                            self.logger.info(
-                                f"Retrying classification after {retry_delay}s delay",
+                            attempt_logger.info(
+                                "Retrying classification after delay",
+                                delay_seconds=retry_delay,
                                 remaining_retries=max_retries - attempt,
                             )
                             await asyncio.sleep(retry_delay)
@@ -280,52 +429,142 @@ Return ONLY: {{"is_scam": bool, "confidence": float, "scam_type": str|null, "thr
                 is_scam=False,
                 confidence=0.5,
                 reasoning=f"AI classification failed: {str(e)}",
+                failed=True,
             )
 
+    async def _call_model(
+        self,
+        model_name: str,
+        prompt: str,
+        timeout: float,
+        config: "types.GenerateContentConfig | None" = None,
+    ) -> str:
+        """Run one classification call and return its text parts."""
+        # Native async SDK call: no executor thread hop per attempt
+        response = await asyncio.wait_for(
+            self.client.aio.models.generate_content(
+                model=model_name,
+                contents=prompt,
+                config=config or self._config,
+            ),
+            timeout=timeout,
+        )
+        # Use helper to avoid thought_signature warning in Gemini 3
+        return _extract_text_from_response(response)
+
+    # ── Micro-batching ───────────────────────────────────────────────────────
+
+    async def _classify_batched(self, prompt: str) -> ClassificationResult | None:
+        """Queue a prompt for the batch worker and wait for its result.
+
+        Returns:
+            The classification, or None if the batch call failed or the
+            request ended up alone in its window
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._batch_queue
+        if (
+            queue is None
+            or self._batch_loop is not loop
+            or self._batch_worker is None
+            or self._batch_worker.done()
+        ):
+            self._batch_loop = loop
+            queue = self._batch_queue = asyncio.Queue()
+            # Empty context: the long-lived worker and the batches it spawns
+            # must not inherit (and log under) the first caller's request fields
+            self._batch_worker = loop.create_task(
+                self._run_batch_worker(queue), context=contextvars.Context()
+            )
+
+        future: asyncio.Future[ClassificationResult | None] = loop.create_future()
+        await queue.put((prompt, future))
+        return await future
+
+    async def _run_batch_worker(self, queue: asyncio.Queue[_BatchItem]) -> None:
+        """Collect queued prompts into batches of up to ``classifier_batch_max``."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self._batch_window
+            while len(batch) < self._batch_max:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except TimeoutError:
+                    break
+            # Run the call concurrently so the next window starts collecting now
+            run = loop.create_task(self._run_batch(batch))
+            self._batch_runs.add(run)
+            run.add_done_callback(self._batch_runs.discard)
+
+    async def _run_batch(self, batch: list[_BatchItem]) -> None:
+        """Classify a batch with one model call and resolve each waiter."""
+        results: list[ClassificationResult | None] = [None] * len(batch)
+        if len(batch) > 1:
+            prompt = self.BATCH_PROMPT_HEADER.format(count=len(batch)) + "".join(
+                f"### REQUEST {i}\n{item_prompt}\n" for i, (item_prompt, _) in enumerate(batch, 1)
+            )
+            max_tokens = self._config.max_output_tokens
+            config = self._config.model_copy(
+                update={
+                    # Unset stays unset: the model default then applies to the batch
+                    "max_output_tokens": None if max_tokens is None else max_tokens * len(batch),
+                    "response_schema": list[_ClassificationSchema],
+                }
+            )
+            # Already loaded by the client; imported here to keep module import lazy
+            from google.genai import errors as genai_errors
+
+            try:
+                text = await self._call_model(
+                    self.model, prompt, self.settings.api_timeout_seconds, config
+                )
+                data = orjson.loads(self._strip_code_fence(text))
+                if not isinstance(data, list) or len(data) != len(batch):
+                    raise ValueError(f"Expected {len(batch)} results, got {type(data).__name__}")
+                results = [
+                    self._result_from_data(item) if isinstance(item, dict) else None
+                    for item in data
+                ]
+                self._last_model_used = self.model
+                self.logger.info("Batch classification successful", batch_size=len(batch))
+            except (TimeoutError, ValueError, KeyError, TypeError, genai_errors.APIError) as e:
+                # orjson.JSONDecodeError is a ValueError; KeyError/TypeError come
+                # from malformed result objects, as in _parse_response
+                self.logger.warning(
+                    "Batch classification failed, classifying individually",
+                    batch_size=len(batch),
+                    error=str(e),
+                )
+            except Exception as e:
+                # A bug, not a model failure: surface it to every waiter. Not
+                # re-raised, since nothing awaits this fire-and-forget task
+                self.logger.exception("Batch classification raised", batch_size=len(batch))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
     def _format_history(self, history: list[ConversationMessage]) -> str:
         """Format conversation history for the prompt."""
         if not history:
             return "No previous messages"
 
-        lines = []
-        for msg in history[-5:]:  # Last 5 messages for context
-            # Handle both enum and string sender types
-            sender_str = msg.sender.value if hasattr(msg.sender, 'value') else str(msg.sender)
-            sender = "SCAMMER" if sender_str == "scammer" else "USER"
-            lines.append(f"[{sender}]: {msg.text}")
-
-        return "\n".join(lines)
+        # Last 5 messages for context
+        return _format_history_window(tuple((msg.sender, msg.text) for msg in history[-5:]))
 
     def _parse_response(self, response_text: str) -> ClassificationResult:
         """Parse AI response JSON into ClassificationResult."""
         try:
-            # Clean response (remove markdown if present)
-            text = response_text.strip()
-            if text.startswith("```"):
-                # Extract content between code fences
-                lines = text.split("\n")
-                # Find start and end of code block
-                start_idx = 1 if lines[0].startswith("```") else 0
-                end_idx = len(lines)
-                for i in range(len(lines) - 1, 0, -1):
-                    if lines[i].strip() == "```":
-                        end_idx = i
-                        break
-                text = "\n".join(lines[start_idx:end_idx])
-                # Remove json language identifier if present
-                if text.startswith("json"):
-                    text = text[4:].strip()
-
-            data = json.loads(text)
-
-            return ClassificationResult(
-                is_scam=bool(data.get("is_scam", False)),
-                confidence=float(data.get("confidence", 0.5)),
-                scam_type=data.get("scam_type"),
-                threat_indicators=data.get("threat_indicators", []),
-                reasoning=data.get("reasoning", ""),
-            )
-        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            # orjson parses str directly (no encode round trip) in C
+            return self._result_from_data(orjson.loads(self._strip_code_fence(response_text)))
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
             self.logger.warning(
                 "Failed to parse AI response",
                 error=str(e),
@@ -335,4 +574,28 @@ Return ONLY: {{"is_scam": bool, "confidence": float, "scam_type": str|null, "thr
                 is_scam=False,
                 confidence=0.5,
                 reasoning=f"Parse error: {str(e)}",
+                failed=True,
             )
+
+    @staticmethod
+    def _strip_code_fence(response_text: str) -> str:
+        """Clean response (remove markdown if present)."""
+        # No-ops when the fences are absent; the closing fence may be cut off
+        return (
+            response_text.strip()
+            .removeprefix("```json")
+            .removeprefix("```")
+            .removesuffix("```")
+            .strip()
+        )
+
+    @staticmethod
+    def _result_from_data(data: dict[str, Any]) -> ClassificationResult:
+        """Build a ClassificationResult from one parsed JSON result object."""
+        return ClassificationResult(
+            is_scam=bool(data.get("is_scam", False)),
+            confidence=float(data.get("confidence", 0.5)),
+            scam_type=data.get("scam_type"),
+            threat_indicators=data.get("threat_indicators", []),
+            reasoning=data.get("reasoning", ""),
+        )
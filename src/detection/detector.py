@@ -5,7 +5,10 @@ falling back to LLM classification only when regex is inconclusive.
 This saves ~150ms per turn on the common path.
 """
 
+import asyncio
+import contextvars
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 import structlog
@@ -15,6 +18,16 @@ from src.detection.classifier import ScamClassifier, ClassificationResult
 
 logger = structlog.get_logger()
 
+# (message, last 5 (sender, text) pairs, (channel, locale), previous verdict)
+_ClassificationKey = tuple[
+    str,
+    tuple[tuple[str, str], ...],
+    tuple[str, str] | None,
+    tuple[bool, float] | None,
+]
+# (normalized message, (channel, locale))
+_FirstMessageKey = tuple[str, tuple[str, str] | None]
+
 
 @dataclass
 class DetectionResult:
@@ -73,6 +86,10 @@ SAFE_PATTERNS: list[re.Pattern] = [
 ]
 
 
+# Opening texts worth remembering: campaigns and probes resend the same ones
+FIRST_MESSAGE_CACHE_SIZE = 1024
+
+
 class ScamDetector:
     """Regex-first scam detector with AI fallback.
 
@@ -87,6 +104,13 @@ class ScamDetector:
     def __init__(self) -> None:
         self.logger = logger.bind(component="ScamDetector")
         self._classifier: ScamClassifier | None = None  # lazy-init to avoid cold-start cost
+        # In-flight LLM classifications keyed by their full prompt inputs, so
+        # concurrent identical requests (scripted campaigns) share one call
+        self._inflight: dict[_ClassificationKey, asyncio.Task[ClassificationResult]] = {}
+        # [callers joined, callers still awaiting] per in-flight classification
+        self._inflight_callers: dict[_ClassificationKey, list[int]] = {}
+        # LLM verdicts for context-free first messages, keyed by normalized text
+        self._first_message_cache: OrderedDict[_FirstMessageKey, ClassificationResult] = OrderedDict()
 
     @property
     def classifier(self) -> ScamClassifier:
@@ -133,6 +157,93 @@ class ScamDetector:
 
         return None  # inconclusive → need LLM
 
+    # ── LLM fallback ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _classification_key(
+        message: str,
+        history: list[ConversationMessage] | None,
+        metadata: Metadata | None,
+        previous: ClassificationResult | None,
+    ) -> _ClassificationKey:
+        """Key covering every input the classifier prompt is built from."""
+        return (
+            message,
+            tuple((m.sender, m.text) for m in (history or ())[-5:]),
+            (metadata.channel, metadata.locale) if metadata else None,
+            (previous.is_scam, previous.confidence) if previous else None,
+        )
+
+    @staticmethod
+    def _first_message_key(
+        message: str,
+        history: list[ConversationMessage] | None,
+        metadata: Metadata | None,
+        previous: DetectionResult | None,
+    ) -> _FirstMessageKey | None:
+        """Cache key for a first message, or None when context could change the verdict."""
+        if history or previous is not None:
+            return None
+        return (
+            " ".join(message.lower().split()),
+            (metadata.channel, metadata.locale) if metadata else None,
+        )
+
+    async def _classify_coalesced(
+        self,
+        message: str,
+        history: list[ConversationMessage] | None,
+        metadata: Metadata | None,
+        previous: ClassificationResult | None,
+    ) -> ClassificationResult:
+        """Run the LLM classifier, sharing one call across identical concurrent requests.
+
+        The shared task is shielded so a cancelled caller (e.g. a request that
+        hit its budget) doesn't cancel the classification for the others; it is
+        only cancelled once every caller has gone. It runs in an empty context so
+        its logs don't carry the first caller's request fields.
+        """
+        key = self._classification_key(message, history, metadata, previous)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self.classifier.classify(
+                    message=message,
+                    history=history,
+                    metadata=metadata,
+                    previous_classification=previous,
+                ),
+                context=contextvars.Context(),
+            )
+            self._inflight[key] = task
+            callers = self._inflight_callers[key] = [1, 1]
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        else:
+            callers = self._inflight_callers[key]
+            callers[0] += 1
+            callers[1] += 1
+            self.logger.info("Joining in-flight classification", inflight=len(self._inflight))
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            callers[1] -= 1
+            if callers[1] == 0 and not task.done():
+                # Nobody is left to use the verdict; let new callers start afresh
+                self._inflight.pop(key, None)
+                self._inflight_callers.pop(key, None)
+                task.cancel()
+            raise
+
+    def _finish_inflight(
+        self, key: _ClassificationKey, task: asyncio.Task[ClassificationResult]
+    ) -> None:
+        """Drop a finished shared classification and log how many callers it served."""
+        if self._inflight.get(key) is not task:
+            return
+        del self._inflight[key]
+        joined, _ = self._inflight_callers.pop(key)
+        self.logger.info("In-flight classification finished", callers=joined)
+
     # ── Main entry point ─────────────────────────────────────────────────────
 
     async def analyze(
@@ -178,12 +289,22 @@ class ScamDetector:
                 scam_type=previous_result.scam_type,
             )
 
-        ai_result = await self.classifier.classify(
-            message=message,
-            history=history,
-            metadata=metadata,
-            previous_classification=prev_classification,
-        )
+        cache_key = self._first_message_key(message, history, metadata, previous_result)
+        ai_result = None
+        if cache_key is not None:
+            ai_result = self._first_message_cache.get(cache_key)
+            if ai_result is not None:
+                self._first_message_cache.move_to_end(cache_key)
+                self.logger.info("First-message classification cache hit")
+        if ai_result is None:
+            ai_result = await self._classify_coalesced(
+                message, history, metadata, prev_classification
+            )
+            # Only successful benign verdicts are reused; failures must be retried
+            if cache_key is not None and not ai_result.failed and not ai_result.is_scam:
+                self._first_message_cache[cache_key] = ai_result
+                if len(self._first_message_cache) > FIRST_MESSAGE_CACHE_SIZE:
+                    self._first_message_cache.popitem(last=False)
 
         # Confidence can only INCREASE from previous (persistent suspicion)
         final_confidence = ai_result.confidence
@@ -4,28 +4,28 @@
 class StickyNetError(Exception):
     """Base exception for Sticky-Net."""
 
-    pass
+    __slots__ = ()
 
 
 class ScamDetectionError(StickyNetError):
     """Error during scam detection."""
 
-    pass
+    __slots__ = ()
 
 
 class AgentEngagementError(StickyNetError):
     """Error during agent engagement."""
 
-    pass
+    __slots__ = ()
 
 
 class IntelligenceExtractionError(StickyNetError):
     """Error during intelligence extraction."""
 
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(StickyNetError):
     """Configuration or environment error."""
 
-    pass
+    __slots__ = ()
@@ -0,0 +1,64 @@
+"""Hedged primary/fallback model requests shared by the agent and classifier."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import structlog
+
+
+async def hedged_call(
+    call: Callable[[str], Awaitable[str]],
+    primary_model: str,
+    fallback_model: str,
+    hedge_delay: float,
+    logger: structlog.stdlib.BoundLogger,
+) -> tuple[str, str] | None:
+    """Race the primary model against a delayed fallback model.
+
+    The fallback starts after ``hedge_delay`` seconds, or as soon as the
+    primary fails. The first non-empty reply wins and the other call is
+    cancelled.
+
+    Args:
+        call: Coroutine factory taking a model name and returning its text
+        primary_model: Model started immediately
+        fallback_model: Model started after the hedge delay
+        hedge_delay: Seconds to wait before starting the fallback
+        logger: Logger for per-model failures
+
+    Returns:
+        Tuple of (model_name, response_text), or None if both failed
+    """
+    primary_failed = asyncio.Event()
+
+    async def _attempt(model_name: str, hedge: bool) -> tuple[str, str]:
+        if hedge:
+            try:
+                await asyncio.wait_for(primary_failed.wait(), timeout=hedge_delay)
+            except TimeoutError:
+                pass
+        text = await call(model_name)
+        if not text.strip():
+            raise ValueError("Empty response from model")
+        return model_name, text
+
+    primary = asyncio.create_task(_attempt(primary_model, hedge=False))
+    fallback = asyncio.create_task(_attempt(fallback_model, hedge=True))
+    pending = {primary, fallback}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                if task is primary:
+                    primary_failed.set()
+                logger.warning(
+                    "Model failed in hedged request",
+                    model=primary_model if task is primary else fallback_model,
+                    error=repr(task.exception()),
+                )
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
@@ -12,6 +12,7 @@ Suspicious keyword extraction is done entirely by AI (not regex) because:
 
 import re
 from dataclasses import dataclass, field
+from functools import _CacheInfo, lru_cache
 from typing import Any
 
 import structlog
@@ -23,10 +24,92 @@ from src.intelligence.validators import (
     validate_beneficiary_name,
 )
 
+try:
+    # Optional DFA engine (pip install sticky-net[re2]): linear-time scans,
+    # no backtracking on long scammer messages. Same API as ``re`` for the
+    # calls used here
+    import re2 as _scan_re  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on installed extras
+    _scan_re = re
+
 logger = structlog.get_logger()
 
+# Per-text scan results memoized per extractor: every turn resends the whole
+# conversation, so all but the newest scammer message were scanned before
+EXTRACT_CACHE_SIZE = 4096
+
+# Scan output: (bank_accounts, upi_ids, phone_numbers, phishing_links, emails)
+_ScanResult = tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[str, ...]]
+
+# =============================================================================
+# REGEX PATTERNS FOR SCANNING (compiled once at import)
+# =============================================================================
+#
+# These stay separate scans rather than one named-group alternation: their
+# matches overlap (a phone inside an account-length run or a UPI handle,
+# digits inside a URL) and an alternation consumes each span once, losing
+# them. Behind the literal prefilters in extract() separate scans are also
+# faster on the common no-intel message
+
+
+def _compile_ascii(pattern: str) -> re.Pattern[str]:
+    """Compile a scan pattern with ASCII-only digit, word and boundary classes.
+
+    Phone, account and UPI data is ASCII, and ASCII classes skip the Unicode
+    category lookups (20-40% faster scans). This also matches RE2, whose
+    classes are ASCII by default and which takes no ``re`` flags.
+    """
+    return re.compile(pattern, re.ASCII) if _scan_re is re else _scan_re.compile(pattern)
+
+
+def _re_only(lookaround: str) -> str:
+    """Return a lookaround fragment when scanning with the stdlib ``re`` engine.
+
+    The fragments are pure speedups that never change what matches: a
+    leading lookahead naming a pattern's possible first characters lets the
+    backtracking engine skip straight to candidate positions, and a negative
+    lookahead rejects candidates the Python-side validation would drop
+    anyway. RE2 has no lookarounds (and scans linearly regardless), so they
+    are left out there.
+    """
+    return lookaround if _scan_re is re else ""
+
 
-@dataclass
+# Any digit: phone and account scans are skipped for text without one
+_DIGIT_PATTERN = _compile_ascii(r"\d")
+
+# Indian mobile numbers with optional +91 / 91 prefix. Compiled without
+# re.ASCII so that under the stdlib engine the prefix separator may be any
+# Unicode space (e.g. a non-breaking space). RE2's \s is ASCII-only, so there
+# such a prefix is not consumed and only the bare 10 digits are captured
+_PHONE_SCAN_PATTERN: re.Pattern[str] = _scan_re.compile(
+    _re_only("(?=[+6-9])") + r"(?:\+?91[\s-]?)?([6-9]\d{9})\b"
+)
+
+# Bank account candidates: standalone 9-18 digit runs. Phone-shaped runs
+# (10 digits from 6-9, or 91 + such a number) are rejected in-scan;
+# _validate_bank_account still excludes them where no lookahead is used
+_ACCOUNT_SCAN_PATTERN = _compile_ascii(
+    _re_only(r"(?=\d)")
+    + r"\b"
+    + _re_only(r"(?!(?:[6-9]\d{9}|91[6-9]\d{9})\b)")
+    + r"(\d{9,18})\b"
+)
+
+# Any user@something token; split into UPI IDs vs emails afterwards
+_AT_HANDLE_SCAN_PATTERN = _compile_ascii(r"([\w.+-]+@[\w.-]+)")
+
+# Phishing links: http/https URLs
+_URL_SCAN_PATTERN: re.Pattern[str] = _scan_re.compile(r'https?://[^\s<>"\')]+')
+
+# Number formatting characters stripped by _clean_number
+_NUMBER_FORMATTING_PATTERN: re.Pattern[str] = _scan_re.compile(r"[-\s().+]")
+
+# UPI ID shape check: user@provider with an alphanumeric provider
+_UPI_FORMAT_PATTERN = _compile_ascii(r"^[\w.-]+@[a-zA-Z][a-zA-Z0-9]*$")
+
+
+@dataclass(slots=True)
 class ExtractionResult:
     """Extraction result (kept for backward compatibility)."""
 
@@ -92,6 +175,13 @@ class IntelligenceExtractor:
     def __init__(self) -> None:
         """Initialize extractor."""
         self.logger = logger.bind(component="IntelligenceExtractor")
+        # Bound per instance so the cache dies with the extractor; results are
+        # tuples, so cached entries can't be mutated through a returned result
+        self._scan_cached = lru_cache(maxsize=EXTRACT_CACHE_SIZE)(self._scan_text)
+
+    def cache_info(self) -> _CacheInfo:
+        """Return hit/miss statistics of the per-text regex scan cache."""
+        return self._scan_cached.cache_info()
 
     # =========================================================================
     # MAIN API: Validate AI Extraction
@@ -206,49 +296,68 @@ class IntelligenceExtractor:
         no fakeData is missed.
         """
         self.logger.debug("Running regex backup extraction")
-        
-        phones = []
-        for match in re.finditer(r'(?:\+?91[\s-]?)?([6-9]\d{9})\b', text):
-            clean = self._clean_number(match.group(0))
-            if self._validate_phone(clean):
-                phones.append(clean)
-        
-        # Bank accounts: 9-18 digit numbers (exclude phone-like)
-        accounts = []
-        for match in re.finditer(r'\b(\d{9,18})\b', text):
-            num = match.group(1)
-            if self._validate_bank_account(num) and not self._looks_like_phone(num):
-                accounts.append(num)
-        
+        accounts, upi_ids, phones, urls, emails = self._scan_cached(text)
+        return ExtractionResult(
+            bank_accounts=list(accounts),
+            upi_ids=list(upi_ids),
+            phone_numbers=list(phones),
+            phishing_links=list(urls),
+            emails=list(emails),
+            source=ExtractionSource.REGEX,
+        )
+
+    def _scan_text(self, text: str) -> _ScanResult:
+        """Run the regex scans over ``text``; deduplicated, first-seen order."""
+        # Each scan needs a literal its pattern cannot match without
+        # (a digit, "@" or "http"); checking that first skips the regex
+        # engine entirely on the many messages that carry no intel
+        has_digit = _DIGIT_PATTERN.search(text) is not None
+
+        # Insertion-ordered dicts dedupe as they fill (scammers repeat the same
+        # number/UPI ID) and let repeats skip validation; materialized once
+        phones: dict[str, None] = {}
+        accounts: dict[str, None] = {}
+        if has_digit:
+            for match in _PHONE_SCAN_PATTERN.finditer(text):
+                # The match is an optional "+91"/"91" plus at most one space or
+                # hyphen, then the 10 captured digits, so its cleaned form is
+                # known without running _clean_number over it
+                if match.start() == match.start(1):
+                    clean = match[1]
+                else:
+                    clean = "91" + match[1]
+                if clean not in phones and self._validate_phone(clean):
+                    phones[clean] = None
+
+            # Bank accounts: 9-18 digit numbers (the validator excludes phone-like)
+            for match in _ACCOUNT_SCAN_PATTERN.finditer(text):
+                num = match[1]
+                if num not in accounts and self._validate_bank_account(num):
+                    accounts[num] = None
+
         # UPI IDs and Emails: split based on dot-in-domain rule
         # Match any user@something pattern
-        upi_ids = []
-        emails = []
-        for match in re.finditer(r'([\w.+-]+@[\w.-]+)', text):
-            candidate = match.group(1).lower().rstrip('.')
-            parts = candidate.split('@')
-            if len(parts) != 2 or not parts[0] or not parts[1]:
-                continue
-            domain = parts[1]
-            if '.' in domain:
-                # Email: user@domain.tld (e.g., scam@fake.com, offers@fake-amazon.co.in)
-                emails.append(candidate)
-            else:
-                # UPI: user@provider (e.g., scammer@ybl, ravi@paytm, x@okaxis)
-                if self._validate_upi_id(candidate):
-                    upi_ids.append(candidate)
+        upi_ids: dict[str, None] = {}
+        emails: dict[str, None] = {}
+        if "@" in text:
+            for match in _AT_HANDLE_SCAN_PATTERN.finditer(text):
+                candidate = match.group(1).lower().rstrip('.')
+                parts = candidate.split('@')
+                if len(parts) != 2 or not parts[0] or not parts[1]:
+                    continue
+                domain = parts[1]
+                if '.' in domain:
+                    # Email: user@domain.tld (e.g., scam@fake.com, offers@fake-amazon.co.in)
+                    emails[candidate] = None
+                else:
+                    # UPI: user@provider (e.g., scammer@ybl, ravi@paytm, x@okaxis)
+                    if candidate not in upi_ids and self._validate_upi_id(candidate):
+                        upi_ids[candidate] = None
         
         # Phishing links: http/https URLs
-        urls = re.findall(r'https?://[^\s<>"\')]+', text)
-        
-        return ExtractionResult(
-            bank_accounts=accounts,
-            upi_ids=upi_ids,
-            phone_numbers=phones,
-            phishing_links=urls,
-            emails=emails,
-            source=ExtractionSource.REGEX,
-        )
+        urls = dict.fromkeys(_URL_SCAN_PATTERN.findall(text)) if "http" in text else {}
+
+        return tuple(accounts), tuple(upi_ids), tuple(phones), tuple(urls), tuple(emails)
 
     def extract_from_conversation(
         self,
@@ -259,27 +368,25 @@ class IntelligenceExtractor:
         
         Scans only scammer messages to avoid extracting victim's own data.
         """
-        combined = ExtractionResult(source=ExtractionSource.REGEX)
-        
+        self.logger.debug("Running regex backup extraction")
+
+        # Scanned message by message so earlier turns come from the scan
+        # cache; dicts merge the per-message results deduplicated in order
+        buckets: tuple[dict[str, None], ...] = ({}, {}, {}, {}, {})
         for msg in messages:
-            sender = msg.get("sender", "")
-            text = msg.get("text", "")
-            if sender == "scammer" and text:
-                result = self.extract(text)
-                combined.bank_accounts.extend(result.bank_accounts)
-                combined.upi_ids.extend(result.upi_ids)
-                combined.phone_numbers.extend(result.phone_numbers)
-                combined.phishing_links.extend(result.phishing_links)
-                combined.emails.extend(result.emails)
-        
-        # Deduplicate
-        combined.bank_accounts = list(set(combined.bank_accounts))
-        combined.upi_ids = list(set(combined.upi_ids))
-        combined.phone_numbers = list(set(combined.phone_numbers))
-        combined.phishing_links = list(set(combined.phishing_links))
-        combined.emails = list(set(combined.emails))
-        
-        return combined
+            if msg.get("sender", "") == "scammer" and (text := msg.get("text", "")):
+                for bucket, found in zip(buckets, self._scan_cached(text)):
+                    bucket.update(dict.fromkeys(found))
+
+        accounts, upi_ids, phones, urls, emails = buckets
+        return ExtractionResult(
+            bank_accounts=list(accounts),
+            upi_ids=list(upi_ids),
+            phone_numbers=list(phones),
+            phishing_links=list(urls),
+            emails=list(emails),
+            source=ExtractionSource.REGEX,
+        )
 
     def parse_ai_extraction(
         self,
@@ -316,11 +423,11 @@ class IntelligenceExtractor:
         Returns ai_result with any additional items from regex_result added.
         """
         merged = ExtractionResult(
-            bank_accounts=list(set(ai_result.bank_accounts + regex_result.bank_accounts)),
-            upi_ids=list(set(ai_result.upi_ids + regex_result.upi_ids)),
-            phone_numbers=list(set(ai_result.phone_numbers + regex_result.phone_numbers)),
-            phishing_links=list(set(ai_result.phishing_links + regex_result.phishing_links)),
-            emails=list(set(ai_result.emails + regex_result.emails)),  # ExtractionResult uses 'emails'
+            bank_accounts=list(set(ai_result.bank_accounts).union(regex_result.bank_accounts)),
+            upi_ids=list(set(ai_result.upi_ids).union(regex_result.upi_ids)),
+            phone_numbers=list(set(ai_result.phone_numbers).union(regex_result.phone_numbers)),
+            phishing_links=list(set(ai_result.phishing_links).union(regex_result.phishing_links)),
+            emails=list(set(ai_result.emails).union(regex_result.emails)),  # ExtractionResult uses 'emails'
             beneficiary_names=ai_result.beneficiary_names,
             bank_names=ai_result.bank_names,
             ifsc_codes=ai_result.ifsc_codes,
@@ -361,7 +468,8 @@ class IntelligenceExtractor:
         Returns:
             Validated ExtractedIntelligence
         """
-        validated = ExtractedIntelligence(
+        # Every field is a filtered copy of an already-validated model
+        validated = ExtractedIntelligence.model_construct(
             bankAccounts=[acc for acc in llm_intel.bankAccounts if self._validate_bank_account(self._clean_number(acc))],
             upiIds=[upi for upi in llm_intel.upiIds if self._validate_upi_id(upi)],
             phoneNumbers=[p for p in llm_intel.phoneNumbers if self._validate_phone(self._clean_number(p))],
@@ -398,7 +506,7 @@ class IntelligenceExtractor:
 
     def _clean_number(self, number: str) -> str:
         """Remove formatting from numbers (spaces, hyphens, parentheses, dots)."""
-        return re.sub(r"[-\s().+]", "", number)
+        return _NUMBER_FORMATTING_PATTERN.sub("", number)
 
     def _validate_bank_account(self, account: str) -> bool:
         """
@@ -432,7 +540,7 @@ class IntelligenceExtractor:
         """
         if "@" not in upi:
             return False
-        return bool(re.match(r'^[\w.-]+@[a-zA-Z][a-zA-Z0-9]*$', upi))
+        return bool(_UPI_FORMAT_PATTERN.match(upi))
 
     def _validate_phone(self, phone: str) -> bool:
         """
@@ -6,12 +6,13 @@ from contextlib import asynccontextmanager
 from collections.abc import AsyncGenerator
 from pathlib import Path
 
+import orjson
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, Response
 
 from src.api.routes import router
 from src.api.middleware import setup_middleware
@@ -20,6 +21,12 @@ from config.settings import get_settings
 # Static files directory
 STATIC_DIR = Path(__file__).parent / "static"
 
+# Constant JSON bodies, serialized once instead of per response
+_VALIDATION_FALLBACK_BODY = orjson.dumps(
+    {"status": "success", "reply": "sorry i didnt understand that... can you say again?"}
+)
+_HEALTHY_BODY = orjson.dumps({"status": "healthy"})
+
 # Configure standard library logging to output to console
 logging.basicConfig(
     format="%(message)s",
@@ -27,24 +34,55 @@ logging.basicConfig(
     level=logging.INFO,
 )
 
-# Configure structured logging with console-friendly output
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.dev.ConsoleRenderer(colors=True),  # Human-readable output for dev
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+
+def configure_logging(log_format: str, log_level: str) -> None:
+    """Configure structlog for the given output format.
+
+    ``json`` (production) renders events with orjson straight to stdout bytes,
+    bypassing stdlib logging dispatch. ``console`` keeps the human-readable
+    stdlib-backed output for local development. Both filter by ``log_level``
+    in the bound logger itself, so disabled levels cost a no-op method call.
+    """
+    if log_format == "json":
+        structlog.configure(
+            processors=[
+                structlog.contextvars.merge_contextvars,
+                structlog.processors.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.format_exc_info,
+                structlog.processors.JSONRenderer(serializer=orjson.dumps),
+            ],
+            wrapper_class=structlog.make_filtering_bound_logger(
+                logging.getLevelName(log_level.upper())
+            ),
+            context_class=dict,
+            logger_factory=structlog.BytesLoggerFactory(),
+            cache_logger_on_first_use=True,
+        )
+        return
+
+    # Configure structured logging with console-friendly output.
+    # The filtering wrapper turns calls below log_level into no-ops at the call
+    # site (no event dict, no processors); output still goes through stdlib.
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.format_exc_info,
+            structlog.dev.ConsoleRenderer(colors=True),  # Human-readable output for dev
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(log_level.upper())
+        ),
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+
+configure_logging(get_settings().log_format, get_settings().log_level)
 
 logger = structlog.get_logger()
 
@@ -64,8 +102,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     try:
         from src.agents.honeypot_agent import get_agent
         from src.detection.detector import get_detector
+        from src.intelligence.extractor import get_extractor
         _agent = get_agent()
         _detector = get_detector()
+        get_extractor()
         logger.info(
             "Pre-warmed singletons",
             agent_model=_agent.model,
@@ -126,15 +166,12 @@ def create_app() -> FastAPI:
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
         """Catch Pydantic validation errors and return 200 with a fallback reply."""
         logger.warning("Validation error caught", error=str(exc)[:200], path=request.url.path)
-        return JSONResponse(
-            status_code=200,
-            content={"status": "success", "reply": "sorry i didnt understand that... can you say again?"},
-        )
+        return Response(content=_VALIDATION_FALLBACK_BODY, media_type="application/json")
 
     @app.get("/health")
-    async def health_check() -> dict[str, str]:
+    async def health_check() -> Response:
         """Health check endpoint."""
-        return {"status": "healthy"}
+        return Response(content=_HEALTHY_BODY, media_type="application/json")
 
     @app.get("/")
     async def serve_ui() -> FileResponse:
@@ -11,9 +11,21 @@ os.environ.setdefault("DEBUG", "true")
 import pytest
 from fastapi.testclient import TestClient
 
+from src.agents.honeypot_agent import _get_client
+from src.detection.classifier import _get_client as _get_classifier_client
 from src.main import app
 
 
+@pytest.fixture(autouse=True)
+def _fresh_genai_client():
+    """Drop the shared Gemini clients so each test sees its own patched genai.Client."""
+    _get_client.cache_clear()
+    _get_classifier_client.cache_clear()
+    yield
+    _get_client.cache_clear()
+    _get_classifier_client.cache_clear()
+
+
 @pytest.fixture
 def client() -> TestClient:
     """Create test client."""
@@ -1,5 +1,7 @@
 """Tests for honeypot agent module."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
@@ -27,12 +29,28 @@ def create_mock_gemini_response(text: str) -> MagicMock:
     mock_response.text = text  # Keep for backward compatibility
     
     return mock_response
+
+
+def create_mock_gemini_stream(*chunks: str) -> AsyncMock:
+    """Create a mock for aio.models.generate_content_stream.
+
+    Each call returns a fresh async iterator yielding one response per chunk.
+    """
+    async def _stream():
+        for text in chunks:
+            yield create_mock_gemini_response(text)
+
+    return AsyncMock(side_effect=lambda **kwargs: _stream())
 from src.agents.persona import Persona, PersonaManager, EmotionalState, PersonaTrait
 from src.agents.policy import EngagementPolicy, EngagementMode, EngagementState
 from src.agents.prompts import (
+    HONEYPOT_SYSTEM_PROMPT,
+    bind_fake_data_section,
     get_response_strategy,
     format_scam_indicators,
+    render_system_prompt,
 )
+from src.agents.response_cache import ResponseCache
 from src.api.schemas import Message, ConversationMessage, Metadata, SenderType
 from src.detection.detector import DetectionResult
 
@@ -321,16 +339,16 @@ class TestEngagementPolicy:
 class TestPrompts:
     """Tests for prompt utilities."""
 
-    def test_get_response_strategy_returns_list(self):
+    def test_get_response_strategy_returns_tuple(self):
         """Should return response strategies."""
         strategies = get_response_strategy("urgency")
-        assert isinstance(strategies, list)
+        assert isinstance(strategies, tuple)
         assert len(strategies) > 0
 
     def test_get_response_strategy_fallback(self):
         """Should return default for unknown category."""
         strategies = get_response_strategy("unknown")
-        assert isinstance(strategies, list)
+        assert strategies == get_response_strategy("urgency")
 
     def test_format_scam_indicators_empty(self):
         """Should handle empty indicators."""
@@ -343,6 +361,17 @@ class TestPrompts:
         assert "urgency" in result
         assert "authority" in result
 
+    def test_render_system_prompt_matches_format(self):
+        """Pre-bound prompt segments should render identically to str.format."""
+        fake_section = "- Credit Card: 4111 1111 1111 1111\n- Your Name: Pushpa {Verma}"
+        state = {
+            "turn_number": 4,
+            "extracted_intelligence": '{"upiIds": ["scammer@ybl"]}',
+            "missing_intelligence": "phone number",
+        }
+        expected = HONEYPOT_SYSTEM_PROMPT.format(fake_data_section=fake_section, **state)
+        assert render_system_prompt(bind_fake_data_section(fake_section), **state) == expected
+
 
 class TestHoneypotAgent:
     """Tests for HoneypotAgent class."""
@@ -383,8 +412,9 @@ class TestHoneypotAgent:
         """Agent engagement should return valid result."""
         # Setup mock Gemini client
         mock_client = MagicMock()
-        mock_response = create_mock_gemini_response("Oh no! What should I do?")
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content_stream = create_mock_gemini_stream(
+            "Oh no! What should I do?"
+        )
         mock_client_class.return_value = mock_client
 
         agent = HoneypotAgent()
@@ -411,8 +441,9 @@ class TestHoneypotAgent:
     ):
         """Agent should use conversation history."""
         mock_client = MagicMock()
-        mock_response = create_mock_gemini_response("I understand, please help me.")
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content_stream = create_mock_gemini_stream(
+            "I understand, please help me."
+        )
         mock_client_class.return_value = mock_client
 
         history = [
@@ -437,7 +468,7 @@ class TestHoneypotAgent:
         )
 
         # Verify LLM was called
-        mock_client.models.generate_content.assert_called_once()
+        mock_client.aio.models.generate_content_stream.assert_awaited_once()
         # Verify result is valid
         assert result.response != ""
 
@@ -452,7 +483,7 @@ class TestHoneypotAgent:
     ):
         """Should return fallback response on LLM error."""
         mock_client = MagicMock()
-        mock_client.models.generate_content.side_effect = Exception("LLM Error")
+        mock_client.aio.models.generate_content_stream = AsyncMock(side_effect=Exception("LLM Error"))
         mock_client_class.return_value = mock_client
 
         agent = HoneypotAgent()
@@ -483,6 +514,202 @@ class TestHoneypotAgent:
         new_persona = agent.persona_manager.get_or_create_persona("conv-123")
         assert new_persona.engagement_turn == 0
 
+    @patch("src.agents.honeypot_agent.genai.Client")
+    def test_fake_data_cache_is_bounded(self, mock_client_class):
+        """Fake data cache should evict least recently used conversations."""
+        mock_client_class.return_value = MagicMock()
+        agent = HoneypotAgent()
+        agent._fake_data_cache_max = 2
+
+        first = agent._get_fake_data("conv-1")
+        agent._get_fake_data("conv-2")
+        agent._get_fake_data("conv-1")  # refresh conv-1
+        agent._get_fake_data("conv-3")  # evicts conv-2
+
+        assert list(agent._fake_data_cache) == ["conv-1", "conv-3"]
+        assert agent._get_fake_data("conv-1") is first
+
+    @patch("src.agents.honeypot_agent.genai.Client")
+    @pytest.mark.asyncio
+    async def test_repeated_state_served_from_response_cache(
+        self,
+        mock_client_class,
+        mock_message: Message,
+        mock_metadata: Metadata,
+        mock_detection: DetectionResult,
+    ):
+        """Identical conversation state should reuse the cached reply."""
+        reply_json = (
+            '{"reply_text": "oh no what do i do", "emotional_tone": "panicked", '
+            '"extracted_intelligence": {"upiIds": ["scammer@ybl"]}}'
+        )
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content_stream = create_mock_gemini_stream(reply_json)
+        mock_client_class.return_value = mock_client
+
+        agent = HoneypotAgent()
+        agent._response_cache = ResponseCache()
+        first = await agent.engage(
+            message=mock_message, history=[], metadata=mock_metadata,
+            detection=mock_detection, conversation_id="conv-1",
+        )
+        second = await agent.engage(
+            message=mock_message, history=[], metadata=mock_metadata,
+            detection=mock_detection, conversation_id="conv-1",
+        )
+
+        mock_client.aio.models.generate_content_stream.assert_awaited_once()
+        assert second.response == first.response == "oh no what do i do"
+        assert second.extracted_intelligence.upiIds == ["scammer@ybl"]
+
+    @patch("src.agents.honeypot_agent.genai.Client")
+    @pytest.mark.asyncio
+    async def test_response_cache_not_shared_across_conversations(
+        self,
+        mock_client_class,
+        mock_message: Message,
+        mock_metadata: Metadata,
+        mock_detection: DetectionResult,
+    ):
+        """Conversations with different fake data must each call the model."""
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content_stream = create_mock_gemini_stream(
+            '{"reply_text": "ok", "emotional_tone": "calm", "extracted_intelligence": {}}'
+        )
+        mock_client_class.return_value = mock_client
+
+        agent = HoneypotAgent()
+        agent._response_cache = ResponseCache()
+        for conversation_id in ("conv-a", "conv-b"):
+            await agent.engage(
+                message=mock_message, history=[], metadata=mock_metadata,
+                detection=mock_detection, conversation_id=conversation_id,
+            )
+
+        assert mock_client.aio.models.generate_content_stream.await_count == 2
+        assert len(agent._response_cache) == 2
+
+    def test_response_cache_key_covers_whole_prompt(self):
+        """Long prompts that differ only at the start must not collide."""
+        tail = "x" * 2000
+        system_instruction = "fake account 1234567890"
+
+        assert ResponseCache.make_key("a" + tail, system_instruction, "calm") != (
+            ResponseCache.make_key("b" + tail, system_instruction, "calm")
+        )
+        assert ResponseCache.make_key(tail, system_instruction, "calm") != (
+            ResponseCache.make_key(tail, "fake account 9876543210", "calm")
+        )
+
+    def test_response_cache_disabled_by_default(self):
+        """The agent should not cache replies unless explicitly enabled."""
+        with patch("src.agents.honeypot_agent.genai.Client"):
+            assert HoneypotAgent()._response_cache is None
+
+    @patch("src.agents.honeypot_agent.genai.Client")
+    @pytest.mark.asyncio
+    async def test_hedged_request_uses_faster_fallback(
+        self,
+        mock_client_class,
+        mock_message: Message,
+        mock_metadata: Metadata,
+        mock_detection: DetectionResult,
+    ):
+        """With hedging on, a slow primary should lose to the delayed fallback."""
+        fallback_stream = create_mock_gemini_stream(
+            '{"reply_text": "from fallback", "emotional_tone": "calm", '
+            '"extracted_intelligence": {}}'
+        )
+
+        async def generate(model, contents, config):
+            if model == agent.model:
+                await asyncio.sleep(5)
+            return await fallback_stream(model=model, contents=contents, config=config)
+
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content_stream = AsyncMock(side_effect=generate)
+        mock_client_class.return_value = mock_client
+
+        agent = HoneypotAgent()
+        agent.fallback_model = "fallback-model"
+        agent._hedge_delay = 0.01
+        agent._response_cache = None
+
+        result = await agent.engage(
+            message=mock_message, history=[], metadata=mock_metadata, detection=mock_detection,
+        )
+
+        assert result.response == "from fallback"
+        assert agent._last_model_used == "fallback-model"
+
+
+    @patch("src.agents.honeypot_agent.genai.Client")
+    @pytest.mark.asyncio
+    async def test_stream_stops_once_json_reply_closes(
+        self,
+        mock_client_class,
+        mock_message: Message,
+        mock_metadata: Metadata,
+        mock_detection: DetectionResult,
+    ):
+        """Chunks after the reply object closes should not be consumed."""
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content_stream = create_mock_gemini_stream(
+            '{"reply_text": "wait {what} \\"sir\\"", ',
+            '"emotional_tone": "confused", "extracted_intelligence": {}}',
+            "TRAILING GARBAGE",
+        )
+        mock_client_class.return_value = mock_client
+
+        agent = HoneypotAgent()
+        result = await agent.engage(
+            message=mock_message, history=[], metadata=mock_metadata, detection=mock_detection,
+        )
+
+        assert result.response == 'wait {what} "sir"'
+
+    @patch("src.agents.honeypot_agent.genai.Client")
+    @pytest.mark.asyncio
+    async def test_stream_closed_after_early_stop(
+        self,
+        mock_client_class,
+        mock_message: Message,
+        mock_metadata: Metadata,
+        mock_detection: DetectionResult,
+    ):
+        """Stopping at the closed reply object should close the stream too."""
+        class _Stream:
+            def __init__(self):
+                self.closed = False
+                self._chunks = iter([
+                    '{"reply_text": "ok", "emotional_tone": "calm", "extracted_intelligence": {}}',
+                    "TRAILING GARBAGE",
+                ])
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                try:
+                    return create_mock_gemini_response(next(self._chunks))
+                except StopIteration:
+                    raise StopAsyncIteration from None
+
+            async def aclose(self):
+                self.closed = True
+
+        stream = _Stream()
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content_stream = AsyncMock(return_value=stream)
+        mock_client_class.return_value = mock_client
+
+        agent = HoneypotAgent()
+        await agent.engage(
+            message=mock_message, history=[], metadata=mock_metadata, detection=mock_detection,
+        )
+
+        assert stream.closed
+
 
 class TestConversationSummary:
     """Tests for conversation summary generation when history > context window."""
@@ -569,6 +796,29 @@ class TestConversationSummary:
         assert "SUMMARY" not in prompt
         assert "CONVERSATION HISTORY" in prompt
 
+    @patch("src.agents.honeypot_agent.genai.Client")
+    def test_rolling_history_matches_full_rebuild(self, mock_client_class):
+        """Persona's rolling history window should match a fresh rebuild each turn."""
+        mock_client_class.return_value = MagicMock()
+        agent = HoneypotAgent()
+        persona = Persona()
+        max_turns = agent.settings.context_window_turns
+
+        history = []
+        for i in range(12):
+            sender = SenderType.SCAMMER if i % 2 == 0 else SenderType.USER
+            history.append(
+                ConversationMessage(sender=sender, text=f"msg {i}", timestamp=datetime.now())
+            )
+            rolled = "".join(agent._recent_history_lines(persona, history, max_turns))
+            fresh = "".join(agent._recent_history_lines(Persona(), history, max_turns))
+            assert rolled == fresh
+
+        # A rewritten history must not reuse stale lines
+        rewritten = history[:3]
+        rolled = "".join(agent._recent_history_lines(persona, rewritten, max_turns))
+        assert rolled == "[SCAMMER]: msg 0\n[YOU]: msg 1\n[SCAMMER]: msg 2\n"
+
     @patch("src.agents.honeypot_agent.genai.Client")
     def test_summary_preserves_upi_patterns(self, mock_client_class):
         """Summary should capture UPI IDs from truncated turns."""
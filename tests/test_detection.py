@@ -138,6 +138,142 @@ class TestScamDetector:
             call_args = mock_classify.call_args
             assert call_args.kwargs.get('metadata') == metadata
 
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_messages_share_classification(
+        self, detector: ScamDetector
+    ):
+        """Identical in-flight LLM classifications should be coalesced into one call."""
+        import asyncio
+
+        async def slow_classify(**kwargs):
+            await asyncio.sleep(0.01)
+            return ClassificationResult(is_scam=True, confidence=0.9, scam_type="others")
+
+        with patch.object(
+            detector.classifier, 'classify', side_effect=slow_classify
+        ) as mock_classify:
+            results = await asyncio.gather(
+                *(detector.analyze("Hello there") for _ in range(3))
+            )
+
+        assert mock_classify.call_count == 1
+        assert all(r.confidence == 0.9 for r in results)
+        assert detector._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_shared_classification_runs_outside_caller_context(
+        self, detector: ScamDetector
+    ):
+        """The shared classification must not log with the first caller's session."""
+        import asyncio
+        from structlog.contextvars import bind_contextvars, get_contextvars
+
+        seen: list[dict] = []
+
+        async def slow_classify(**kwargs):
+            seen.append(get_contextvars())
+            await asyncio.sleep(0.01)
+            return ClassificationResult(is_scam=True, confidence=0.9, scam_type="others")
+
+        async def analyze_as(session_id: str) -> DetectionResult:
+            bind_contextvars(session_id=session_id)
+            return await detector.analyze("Hello there")
+
+        with patch.object(detector.classifier, 'classify', side_effect=slow_classify):
+            await asyncio.gather(analyze_as("A"), analyze_as("B"))
+
+        assert seen == [{}]
+
+    @pytest.mark.asyncio
+    async def test_shared_classification_cancelled_when_all_callers_leave(
+        self, detector: ScamDetector
+    ):
+        """A shared classification nobody awaits anymore should be cancelled."""
+        import asyncio
+
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def hanging_classify(**kwargs):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with patch.object(detector.classifier, 'classify', side_effect=hanging_classify):
+            callers = [asyncio.create_task(detector.analyze("Hello there")) for _ in range(2)]
+            await started.wait()
+            callers[0].cancel()
+            await asyncio.sleep(0)
+            assert not cancelled.is_set()
+            callers[1].cancel()
+            await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        assert detector._inflight == {}
+        assert detector._inflight_callers == {}
+
+    @pytest.mark.asyncio
+    async def test_first_message_classification_is_cached(self, detector: ScamDetector):
+        """Repeated context-free first messages should reuse the LLM verdict."""
+        from src.api.schemas import ConversationMessage, SenderType
+
+        history = [
+            ConversationMessage(sender=SenderType.SCAMMER, text="Hello", timestamp=datetime.now())
+        ]
+        with patch.object(
+            detector.classifier,
+            'classify',
+            new_callable=AsyncMock,
+            return_value=ClassificationResult(is_scam=False, confidence=0.2),
+        ) as mock_classify:
+            await detector.analyze("Hello there")
+            await detector.analyze("  hello   THERE ")
+            assert mock_classify.call_count == 1
+
+            # With history the verdict depends on context, so it is not cached
+            await detector.analyze("Hello there", history=history)
+            await detector.analyze("Hello there", history=history)
+            assert mock_classify.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_first_message_scam_verdict_is_not_cached(self, detector: ScamDetector):
+        """Only benign first-message verdicts are reused."""
+        with patch.object(
+            detector.classifier,
+            'classify',
+            new_callable=AsyncMock,
+            return_value=ClassificationResult(is_scam=True, confidence=0.8, scam_type="others"),
+        ) as mock_classify:
+            await detector.analyze("Hello there")
+            await detector.analyze("Hello there")
+            assert mock_classify.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_first_message_failed_classification_is_not_cached(
+        self, detector: ScamDetector
+    ):
+        """A fallback verdict from a failed LLM call should be retried, not cached."""
+        failure = ClassificationResult(
+            is_scam=False,
+            confidence=0.5,
+            reasoning="AI classification failed: timeout",
+            failed=True,
+        )
+        success = ClassificationResult(is_scam=False, confidence=0.1)
+        with patch.object(
+            detector.classifier,
+            'classify',
+            new_callable=AsyncMock,
+            side_effect=[failure, success],
+        ) as mock_classify:
+            await detector.analyze("Hello there")
+            result = await detector.analyze("Hello there")
+            assert mock_classify.call_count == 2
+            assert "Safety net" in result.reasoning
+            assert "0.10" in result.reasoning
+
 
 class TestScamClassifier:
     """Tests for AI ScamClassifier."""
@@ -147,6 +283,19 @@ class TestScamClassifier:
         """Create classifier instance with mocked AI client."""
         return ScamClassifier()
 
+    def test_build_prompt_matches_template_format(self):
+        """The segment-based prompt builder should equal CLASSIFICATION_PROMPT.format."""
+        fields = {
+            "history": "[SCAMMER]: pay {now}",
+            "message": "Verify your account",
+            "channel": "SMS",
+            "locale": "IN",
+            "previous_assessment": "None",
+        }
+        assert ScamClassifier._build_prompt(**fields) == (
+            ScamClassifier.CLASSIFICATION_PROMPT.format(**fields)
+        )
+
     def test_format_history_with_messages(self, classifier: ScamClassifier):
         """Should format conversation history correctly."""
         from src.api.schemas import ConversationMessage, SenderType
@@ -194,6 +343,15 @@ class TestScamClassifier:
         assert result.is_scam is True
         assert result.confidence == 0.9
 
+    def test_parse_response_with_unclosed_fence(self, classifier: ScamClassifier):
+        """Should still parse a fenced reply whose closing fence was cut off."""
+        response = '```json\n{"is_scam": true, "confidence": 0.7}'
+
+        result = classifier._parse_response(response)
+
+        assert result.is_scam is True
+        assert result.confidence == 0.7
+
     def test_parse_invalid_response(self, classifier: ScamClassifier):
         """Should handle invalid JSON gracefully."""
         response = "This is not valid JSON"
@@ -202,3 +360,148 @@ class TestScamClassifier:
 
         assert result.is_scam is False
         assert result.confidence == 0.5
+
+    @pytest.mark.asyncio
+    async def test_hedged_classification_uses_faster_fallback(self, classifier: ScamClassifier):
+        """With hedging on, a slow primary should lose to the delayed fallback."""
+        import asyncio
+
+        async def call_model(model_name, prompt, timeout):
+            if model_name == classifier.model:
+                await asyncio.sleep(5)
+            return '{"is_scam": true, "confidence": 0.8, "scam_type": "others"}'
+
+        classifier.fallback_model = "fallback-model"
+        classifier._hedge_delay = 0.01
+        with patch.object(classifier, '_call_model', side_effect=call_model):
+            result = await classifier.classify("Hello there")
+
+        assert result.is_scam is True
+        assert result.confidence == 0.8
+        assert classifier._last_model_used == "fallback-model"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_classifications_share_one_batch_call(self, classifier: ScamClassifier):
+        """Calls inside one batch window should share a single model call."""
+        import asyncio
+
+        batch_reply = (
+            '[{"is_scam": true, "confidence": 0.9}, '
+            '{"is_scam": false, "confidence": 0.2}, '
+            '{"is_scam": true, "confidence": 0.7}]'
+        )
+        classifier._batch_window = 0.05
+        with patch.object(classifier, '_call_model', return_value=batch_reply) as mock_call:
+            results = await asyncio.gather(
+                classifier.classify("first"),
+                classifier.classify("second"),
+                classifier.classify("third"),
+            )
+
+        assert mock_call.call_count == 1
+        assert "### REQUEST 3" in mock_call.call_args.args[1]
+        assert [r.confidence for r in results] == [0.9, 0.2, 0.7]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_single_calls(self, classifier: ScamClassifier):
+        """A malformed batch reply should fall back to one classification per call."""
+        import asyncio
+
+        async def call_model(model_name, prompt, timeout, config=None):
+            if "### REQUEST" in prompt:
+                return '{"not": "an array"}'
+            return '{"is_scam": true, "confidence": 0.8}'
+
+        classifier._batch_window = 0.05
+        with patch.object(classifier, '_call_model', side_effect=call_model) as mock_call:
+            results = await asyncio.gather(
+                classifier.classify("first"), classifier.classify("second")
+            )
+
+        assert mock_call.call_count == 3
+        assert all(r.confidence == 0.8 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_batch_without_output_token_limit(self, classifier: ScamClassifier):
+        """An unset max_output_tokens should stay unset for the batch call."""
+        import asyncio
+
+        batch_reply = '[{"is_scam": true, "confidence": 0.9}, {"is_scam": true, "confidence": 0.7}]'
+        classifier._config = classifier._config.model_copy(update={"max_output_tokens": None})
+        classifier._batch_window = 0.05
+        with patch.object(classifier, '_call_model', return_value=batch_reply) as mock_call:
+            results = await asyncio.gather(
+                classifier.classify("first"), classifier.classify("second")
+            )
+
+        assert mock_call.call_count == 1
+        assert mock_call.call_args.args[3].max_output_tokens is None
+        assert [r.confidence for r in results] == [0.9, 0.7]
+
+    @pytest.mark.asyncio
+    async def test_batch_worker_does_not_inherit_caller_context(self, classifier: ScamClassifier):
+        """Batches must not log under the session of whoever started the worker."""
+        import asyncio
+        from structlog.contextvars import bind_contextvars, get_contextvars
+
+        seen: list[dict] = []
+
+        async def call_model(model_name, prompt, timeout, config=None):
+            if "### REQUEST" in prompt:
+                seen.append(get_contextvars())
+                return '[{"is_scam": true, "confidence": 0.9}, {"is_scam": true, "confidence": 0.7}]'
+            return '{"is_scam": true, "confidence": 0.8}'
+
+        async def classify_as(session_id: str, text: str) -> ClassificationResult:
+            bind_contextvars(session_id=session_id)
+            return await classifier.classify(text)
+
+        classifier._batch_window = 0.05
+        with patch.object(classifier, '_call_model', side_effect=call_model):
+            await asyncio.create_task(classify_as("A", "first"))
+            await asyncio.gather(classify_as("B", "second"), classify_as("C", "third"))
+
+        assert seen == [{}]
+
+    @pytest.mark.asyncio
+    async def test_unexpected_batch_error_reaches_callers(self, classifier: ScamClassifier):
+        """Programming errors in a batch should propagate, not fall back silently."""
+        import asyncio
+
+        classifier._batch_window = 0.05
+        with patch.object(classifier, '_call_model', side_effect=AttributeError("bug")):
+            results = await asyncio.gather(
+                classifier.classify("first"),
+                classifier.classify("second"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, AttributeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_call_model_uses_native_async_client(self, classifier: ScamClassifier):
+        """Model calls should await the SDK's aio client, not a thread executor."""
+        part = MagicMock(text='{"is_scam": true, "confidence": 0.9}')
+        response = MagicMock()
+        response.candidates = [MagicMock(content=MagicMock(parts=[part]))]
+        classifier.client.aio.models.generate_content = AsyncMock(return_value=response)
+
+        result = await classifier.classify("Hello there")
+
+        classifier.client.aio.models.generate_content.assert_awaited_once()
+        classifier.client.models.generate_content.assert_not_called()
+        assert result.confidence == 0.9
+
+    def test_classifiers_share_one_client(self, mock_genai_client):
+        """Classifier instances should reuse a single genai.Client."""
+        first, second = ScamClassifier(), ScamClassifier()
+
+        assert first.client is second.client
+        assert mock_genai_client.call_count == 1
+
+    def test_config_requests_structured_json(self, classifier: ScamClassifier):
+        """Classification calls should ask Gemini for schema-constrained JSON."""
+        from src.detection.classifier import _ClassificationSchema
+
+        assert classifier._config.response_mime_type == "application/json"
+        assert classifier._config.response_schema is _ClassificationSchema
@@ -1,5 +1,7 @@
 """Tests for AI-first intelligence extraction with regex validation."""
 
+import re
+
 import pytest
 
 from src.intelligence.extractor import IntelligenceExtractor, ExtractionResult
@@ -258,6 +260,81 @@ class TestBackwardCompatibility:
         assert result.has_intelligence
         assert "123456789012" in result.bank_accounts
 
+    def test_extract_from_conversation_keeps_matches_per_message(self, extractor: IntelligenceExtractor):
+        """Matches must not span message boundaries or pick up the victim's messages."""
+        messages = [
+            {"sender": "scammer", "text": "Pay Rs 91"},
+            {"sender": "scammer", "text": "9876543210 is my number"},
+            {"sender": "user", "text": "mine is 9123456789"},
+            {"sender": "scammer", "text": "visit http://fake-bank.com"},
+        ]
+        result = extractor.extract_from_conversation(messages)
+        assert result.phone_numbers == ["9876543210"]
+        assert result.phishing_links == ["http://fake-bank.com"]
+
+    def test_extract_prefilters_each_scan(self, extractor: IntelligenceExtractor):
+        """Each scan should still fire when only its own required literal is present."""
+        assert not extractor.extract("please hurry sir, your KYC is pending").has_intelligence
+        assert extractor.extract("call 9876543210").phone_numbers == ["9876543210"]
+        assert extractor.extract("pay scammer@ybl now").upi_ids == ["scammer@ybl"]
+        assert extractor.extract("open https://fake-kyc.in/update").phishing_links == [
+            "https://fake-kyc.in/update"
+        ]
+
+    def test_extract_cleans_prefixed_phones_only(self, extractor: IntelligenceExtractor):
+        """Prefixed phones keep their cleaned country code; bare ones pass through."""
+        result = extractor.extract("call +91 9876543210 or 9123456789")
+        assert result.phone_numbers == ["919876543210", "9123456789"]
+        assert result.bank_accounts == []
+
+    def test_extract_from_conversation_dedupes_in_order(self, extractor: IntelligenceExtractor):
+        """Repeated identifiers should appear once, in first-seen order."""
+        messages = [
+            {"sender": "scammer", "text": "pay b@ybl or a@ybl, call 9876543210"},
+            {"sender": "scammer", "text": "again: b@ybl, 9876543210 or 9123456789"},
+        ]
+        result = extractor.extract_from_conversation(messages)
+        assert result.upi_ids == ["b@ybl", "a@ybl"]
+        assert result.phone_numbers == ["9876543210", "9123456789"]
+
+    def test_extract_from_conversation_reuses_scans_of_resent_history(
+        self, extractor: IntelligenceExtractor
+    ):
+        """Messages resent on the next turn should come from the scan cache."""
+        history = [{"sender": "scammer", "text": "pay scammer@ybl now"}]
+        first = extractor.extract_from_conversation(history)
+        first.upi_ids.append("mutated@ybl")
+
+        second = extractor.extract_from_conversation(
+            history + [{"sender": "scammer", "text": "or call 9876543210"}]
+        )
+        assert second.upi_ids == ["scammer@ybl"]
+        assert second.phone_numbers == ["9876543210"]
+        assert extractor.cache_info().hits == 1
+
+    def test_extract_scans_ascii_identifiers_only(self, extractor: IntelligenceExtractor):
+        """Account/UPI scans use ASCII classes, so Hindi text around them still splits cleanly."""
+        result = extractor.extract("खाता123456789012 में भेजें, राम@ybl या ram@ybl")
+        assert result.bank_accounts == ["123456789012"]
+        assert result.upi_ids == ["ram@ybl"]
+        assert extractor.extract("खाता १२३४५६७८९०१२").bank_accounts == []
+
+    def test_phone_prefix_unicode_separator_per_engine(self, extractor: IntelligenceExtractor):
+        """A non-breaking space after +91 is a separator under re, not under RE2."""
+        from src.intelligence import extractor as extractor_module
+
+        expected = "919876543210" if extractor_module._scan_re is re else "9876543210"
+        assert extractor.extract("call +91\u00a09876543210").phone_numbers == [expected]
+        assert extractor.extract("call +91 9876543210").phone_numbers == ["919876543210"]
+
+    def test_extract_keeps_overlapping_matches(self, extractor: IntelligenceExtractor):
+        """A span matched by one scan must still be seen by the others."""
+        result = extractor.extract("pay 9876543210@ybl or see http://x.in/pay?acct=123456789012")
+        assert result.upi_ids == ["9876543210@ybl"]
+        assert result.phone_numbers == ["9876543210"]
+        assert result.bank_accounts == ["123456789012"]
+        assert result.phishing_links == ["http://x.in/pay?acct=123456789012"]
+
     def test_parse_ai_extraction_works(self, extractor: IntelligenceExtractor):
         """parse_ai_extraction() should work for backward compatibility."""
         ai_extracted = {
@@ -373,3 +450,16 @@ class TestAIExtractsOnlyScammerDetails:
         
         # Victim's account should NOT appear
         assert "9876543210123" not in result.bankAccounts
+
+
+class TestValidatorCache:
+    """Tests for memoized format validators."""
+
+    def test_repeated_candidate_hits_cache(self):
+        """Validating the same candidate twice should be served from the cache."""
+        from src.intelligence.validators import validate_upi_id
+
+        validate_upi_id.cache_clear()
+        assert validate_upi_id("scammer@ybl") is True
+        assert validate_upi_id("scammer@ybl") is True
+        assert validate_upi_id.cache_info().hits == 1